@@ -0,0 +1,71 @@
+# Rows/sec of the vectorized history parser against the original per-row loop.
+# Run from the repository root: python benchmarks/bench_history_parser.py [rows]
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from nexbank.history_parser import parse_history_table
+
+ROWS = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+REPEAT = 3
+
+
+def make_payload(rows, seed=42):
+    rng = random.Random(seed)
+    lines = ["Date and Time | Sender | Receiver | Amount | Status", "---|---|---|---|---"]
+    for i in range(rows):
+        lines.append(
+            f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d} "
+            f"{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}:{rng.randint(0, 59):02d} | "
+            f"{rng.randint(10**9, 10**10 - 1)} | {rng.randint(10**9, 10**10 - 1)} | "
+            f"{rng.randint(1, 500000) / 100:.2f} | {rng.choice(['SUCCESS', 'FAILED', 'PENDING'])}"
+        )
+    return "\n".join(lines)
+
+
+# The loop app.py used before nexbank.history_parser, followed by the DataFrame build
+def legacy_parse(history_data):
+    lines = history_data.strip().split('\n')
+    headers = [h.strip() for h in lines[0].split('|')]
+    rows = []
+    for line in lines[2:]:
+        if line.strip():
+            values = [v.strip() for v in line.split('|')]
+            if len(values) == len(headers):
+                row_dict = dict(zip(headers, values))
+                rows.append({
+                    "date": row_dict.get("Date and Time", ""),
+                    "fromAccount": row_dict.get("Sender", ""),
+                    "toAccount": row_dict.get("Receiver", ""),
+                    "amount": float(row_dict.get("Amount", 0.0)),
+                    "status": row_dict.get("Status", "")
+                })
+    return pd.DataFrame(rows)
+
+
+def best_of(func, payload):
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        func(payload)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    payload = make_payload(ROWS)
+    legacy = best_of(legacy_parse, payload)
+    vectorized = best_of(lambda text: parse_history_table(text).frame, payload)
+    print(f"rows: {ROWS:,} (best of {REPEAT})")
+    print(f"legacy loop:  {legacy * 1000:8.1f} ms  {ROWS / legacy:12,.0f} rows/sec")
+    print(f"vectorized:   {vectorized * 1000:8.1f} ms  {ROWS / vectorized:12,.0f} rows/sec")
+    print(f"speedup:      {legacy / vectorized:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
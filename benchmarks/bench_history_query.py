@@ -0,0 +1,59 @@
+# Latency of history filters and monthly aggregates on a cached frame, against the
+# 50 ms budget per filter change, plus the one-off cost of building the index.
+# Run from the repository root: python benchmarks/bench_history_query.py [rows]
+import os
+import sys
+import time
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_history_parser import make_payload
+from nexbank import history, history_query
+from nexbank.history_parser import parse_history_table
+
+ROWS = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+REPEAT = 20
+
+
+def timed(func):
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    frame = parse_history_table(make_payload(ROWS)).frame
+    frame = history.compact_frame(frame.sort_values("date", ascending=False, ignore_index=True))
+    owner = int(frame["fromAccount"].iloc[0])
+    entry = {"frame": frame}
+
+    start = time.perf_counter()
+    index = history_query.get_index(entry, owner)
+    print(f"{ROWS:,} rows; index built in {(time.perf_counter() - start) * 1000:.1f} ms, "
+          f"{index.nbytes / 1e6:.1f} MB")
+
+    account = int(index.counterparty[10])
+    cases = {
+        "no filter": {},
+        "one month": {"start": date(2025, 3, 1), "end": date(2025, 4, 1)},
+        "counterparty": {"counterparties": [account]},
+        "amount range": {"min_amount": 100.0, "max_amount": 2000.0},
+        "status": {"statuses": ["FAILED"]},
+        "everything": {"start": date(2025, 2, 1), "end": date(2025, 11, 1), "min_amount": 10.0,
+                       "max_amount": 4000.0, "statuses": ["SUCCESS", "PENDING"]},
+    }
+    print(f"{'filter':>14} {'rows':>8} {'query ms':>9} {'+monthly':>9} {'+page':>7}")
+    for name, filters in cases.items():
+        query_time, positions = timed(lambda: history_query.query(index, **filters))
+        monthly_time, _ = timed(lambda: history_query.monthly_totals(index, positions))
+        page_time, _ = timed(lambda: history.page_frame(frame, 0, positions=positions))
+        print(f"{name:>14} {len(positions):>8,} {query_time * 1000:>9.2f} {monthly_time * 1000:>9.2f} "
+              f"{page_time * 1000:>7.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+# Time and peak Python memory to turn a /get-transaction-history response body into the
+# typed frame: streamed in chunks (history.fetch_history) against reading the whole body,
+# decoding the JSON and parsing the table in one piece.
+# Run from the repository root: python benchmarks/bench_history_stream.py [rows]
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_history_parser import make_payload
+from nexbank import history
+
+ROWS = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+
+
+class BodyResponse:
+    """Just enough of requests.Response to hand out a body in chunks."""
+
+    def __init__(self, body):
+        self.body = body
+
+    def iter_content(self, chunk_size):
+        for start in range(0, len(self.body), chunk_size):
+            yield self.body[start:start + chunk_size]
+
+
+def streamed(body):
+    return history._parse_streamed(history._stream_table_text(history._body_text(BodyResponse(body))))
+
+
+def whole(body):
+    return history.parse_history(json.loads(body.decode("utf-8"))["history"])
+
+
+def measure(parse, body):
+    start = time.perf_counter()
+    frame, _ = parse(body)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    parse(body)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return len(frame), elapsed, peak
+
+
+def main():
+    body = json.dumps({"status": "success", "history": make_payload(ROWS)}).encode("utf-8")
+    print(f"{ROWS:,} rows, {len(body) / 1e6:.1f} MB body")
+    for name, parse in (("streamed", streamed), ("whole body", whole)):
+        rows, elapsed, peak = measure(parse, body)
+        print(f"{name:>10}: {elapsed * 1000:8.0f} ms  peak {peak / 1e6:6.1f} MB  ({rows:,} rows)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+# Cost per rate-limit check as the number of tracked keys and the attempts per key grow,
+# for the ring-buffer window against the old list rescan.
+# Run from the repository root: python benchmarks/bench_ratelimit.py
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nexbank.ratelimit import ATTEMPT_WINDOW, MAX_ATTEMPTS, LocalBackend
+
+CHECKS = 200_000
+
+
+# The per-session list check app.py used before nexbank.ratelimit, minus st.session_state
+def legacy_check(store, user_id, now, limit=MAX_ATTEMPTS):
+    attempts = store.get(user_id, [])
+    attempts = [t for t in attempts if now - t < ATTEMPT_WINDOW]
+    store[user_id] = attempts
+    if len(attempts) >= limit:
+        return False
+    attempts.append(now)
+    store[user_id] = attempts
+    return True
+
+
+def bench_local(keys, limit):
+    backend = LocalBackend(max_keys=keys + 1)
+    now = time.time()
+    start = time.perf_counter()
+    for i in range(CHECKS):
+        backend.hit((str(i % keys), "otp_attempts"), limit, ATTEMPT_WINDOW, now + i * 1e-6)
+    return (time.perf_counter() - start) / CHECKS
+
+
+def bench_legacy(keys, limit):
+    store = {}
+    now = time.time()
+    start = time.perf_counter()
+    for i in range(CHECKS):
+        legacy_check(store, str(i % keys), now + i * 1e-6, limit)
+    return (time.perf_counter() - start) / CHECKS
+
+
+def main():
+    print(f"{CHECKS:,} checks per case, ns/check")
+    print(f"{'keys':>8} {'limit':>6} {'ring buffer':>12} {'legacy list':>12}")
+    # Attempts kept per key stay within the ring size, so memory is keys * limit slots
+    for keys, limit in ((10, MAX_ATTEMPTS), (10, 50), (10, 500),
+                        (1_000, MAX_ATTEMPTS), (1_000, 50),
+                        (100_000, MAX_ATTEMPTS), (100_000, 50)):
+        print(f"{keys:>8,} {limit:>6,} {bench_local(keys, limit) * 1e9:>12,.0f} "
+              f"{bench_legacy(keys, limit) * 1e9:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# Cold-start time and per-rerun cost of the Streamlit script, measured headless with AppTest.
+# Run from the repository root: python benchmarks/bench_startup.py [script ...]
+# To compare against the single-module app, export it first, e.g.
+#   git show <commit>:app.py > /tmp/app_monolith.py
+#   python benchmarks/bench_startup.py app.py /tmp/app_monolith.py
+import json
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RERUNS = 20
+COLD_RUNS = 5
+
+# Runs in a fresh interpreter: first run of the script after streamlit itself is imported
+COLD_START = """
+import json, sys, time
+from streamlit.testing.v1 import AppTest
+start = time.perf_counter()
+AppTest.from_file(sys.argv[1], default_timeout=60).run()
+print(json.dumps({"cold": time.perf_counter() - start}))
+"""
+
+
+def cold_start(script):
+    timings = []
+    for _ in range(COLD_RUNS):
+        output = subprocess.run(
+            [sys.executable, "-c", COLD_START, script],
+            cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout
+        timings.append(json.loads(output.strip().splitlines()[-1])["cold"])
+    return min(timings)
+
+
+# Mean wall time of one rerun, on the main menu and on the login page
+def rerun_cost(script):
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(script, default_timeout=60).run()
+    results = {}
+    for page, key in (("main menu", None), ("login", "login_btn")):
+        if key:
+            at.button(key=key).click().run()
+        start = time.perf_counter()
+        for _ in range(RERUNS):
+            at.run()
+        results[page] = (time.perf_counter() - start) / RERUNS
+    return results
+
+
+def main():
+    scripts = [os.path.abspath(path) for path in sys.argv[1:]] or [os.path.join(ROOT, "app.py")]
+    sys.path.insert(0, ROOT)
+    for script in scripts:
+        print(script)
+        print(f"  cold start (best of {COLD_RUNS}): {cold_start(script) * 1000:8.1f} ms")
+        for page, seconds in rerun_cost(script).items():
+            print(f"  rerun, {page:<10} (mean of {RERUNS}): {seconds * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# Password checks per keystroke (one scan shared by meter and submit check, against
+# the previous five separate passes) and batch validation throughput on an account CSV.
+# Run from the repository root: python benchmarks/bench_validators.py [rows]
+import io
+import os
+import random
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from nexbank import validators
+
+ROWS = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+REPEAT = 5
+
+
+def timed(func):
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+# The checks as they were: each requirement its own pass, run once for the meter and
+# once more for the submit check
+def separate_passes(password):
+    return [
+        len(password) >= 8,
+        any(char.isdigit() for char in password),
+        any(char.islower() for char in password),
+        any(char.isupper() for char in password),
+        any(char in "@#$%^&+=!" for char in password),
+    ]
+
+
+def make_accounts(rows, seed=7):
+    rng = random.Random(seed)
+    alphabet = string.ascii_letters + string.digits + "@#$%^&+=!"
+    passwords = ["".join(rng.choices(alphabet, k=rng.randint(4, 16))) for _ in range(rows)]
+    emails = [f"user{i}@example.com" if rng.random() > 0.05 else f"user{i}example.com" for i in range(rows)]
+    phones = [f"{rng.randrange(10 ** 9, 10 ** 10)}" if rng.random() > 0.05 else "12345" for _ in range(rows)]
+    return pd.DataFrame({"email": emails, "phone": phones, "password": passwords})
+
+
+def main():
+    passwords = make_accounts(10_000)["password"].tolist()
+    old_time, _ = timed(lambda: [(separate_passes(p), separate_passes(p)) for p in passwords])
+    new_time, _ = timed(lambda: [validators.check_password(p) for p in passwords])
+    print(f"password checks, {len(passwords):,} keystrokes: separate passes {old_time * 1000:.1f} ms, "
+          f"single scan {new_time * 1000:.1f} ms")
+
+    frame = make_accounts(ROWS)
+    loop_time, _ = timed(lambda: [
+        (validators.validate_email(e), validators.validate_phone(p), validators.validate_password_strength(w))
+        for e, p, w in zip(frame["email"], frame["phone"], frame["password"])
+    ])
+    frame_time, errors = timed(lambda: validators.validate_frame(frame, 2))
+    text = frame.to_csv(index=False)
+    csv_time, _ = timed(lambda: validators.validate_csv(io.StringIO(text)))
+    print(f"{ROWS:,} accounts, {len(errors):,} errors: per-row loop {loop_time:.2f} s, "
+          f"validate_frame {frame_time:.2f} s, validate_csv {csv_time:.2f} s "
+          f"({ROWS / csv_time:,.0f} rows/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+# Support modules for the Nex Bank Streamlit front end (app.py)
@@ -0,0 +1,172 @@
+import asyncio
+import functools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from nexbank import backend
+
+# asyncio client for the backend, for code that fans out many calls at once (bulk tools,
+# dashboard prefetch). Each call runs nexbank.backend.request on a bounded worker pool,
+# so async callers share the same connection pool, timeouts, retries, instance failover,
+# circuit breakers and metrics as the Streamlit pages. At most `concurrency` calls are
+# in flight per client; the rest wait on a semaphore and can still be cancelled there.
+#
+# Synchronous code drives it through run() / run_all(), which execute coroutines on one
+# process-wide event loop thread:
+#
+#     client = async_backend.get_client()
+#     results = async_backend.run_all(client.send_statement(token, acc, 1, 2025) for acc in accounts)
+
+# Calls in flight at once per client
+ASYNC_CONCURRENCY = int(os.environ.get("NEXBANK_ASYNC_CONCURRENCY", "16"))
+
+
+class AsyncBackend:
+    """Backend endpoints as coroutines, with bounded concurrency.
+
+    Endpoint methods return the requests.Response, like nexbank.backend; callers check it
+    with raise_for_status() and json() as the pages do. transaction_history returns the
+    parsed (frame, malformed) of nexbank.history.fetch_history. A client is bound to the
+    event loop it is first used on.
+    """
+
+    def __init__(self, concurrency=ASYNC_CONCURRENCY):
+        self.concurrency = concurrency
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="nexbank-async")
+
+    async def _call(self, func, *args, **kwargs):
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def request(self, method, path, **kwargs):
+        return await self._call(backend.request, method, path, **kwargs)
+
+    async def get(self, path, **kwargs):
+        return await self.request("GET", path, **kwargs)
+
+    async def post(self, path, **kwargs):
+        return await self.request("POST", path, **kwargs)
+
+    # Registration
+    async def register_init(self, accnumber, email):
+        return await self.post("/register/init", params={"accountNumber": accnumber, "email": email})
+
+    async def register_complete(self, accnumber, otp, question_choice, answer, password1, password2, email):
+        return await self.post("/register/complete", params={
+            "accountNumber": accnumber,
+            "otp": otp,
+            "securityQuestionChoice": question_choice,
+            "securityAnswer": answer,
+            "password1": password1,
+            "password2": password2,
+            "email": email
+        })
+
+    # Login
+    async def login_request_otp(self, accnumber, password):
+        return await self.post("/login/request-otp", params={"accnumber": accnumber, "password": password})
+
+    async def login_verify(self, accnumber, password, otp):
+        return await self.post("/login/verify", params={"accnumber": accnumber, "password": password, "otp": otp})
+
+    # Forgot password
+    async def get_security_question(self, accnumber, phone):
+        return await self.get("/get-security-question", params={"accountNumber": accnumber, "phoneNumber": phone})
+
+    async def verify_security_answer(self, accnumber, answer):
+        return await self.post("/verify-security-answer", json={"accountNumber": accnumber, "answer": answer})
+
+    async def reset_password(self, accnumber, otp, new_password):
+        return await self.post("/reset-password", json={
+            "accountNumber": accnumber,
+            "otp": otp,
+            "newPassword": new_password,
+        })
+
+    # Transfers; `key` is the idempotency key from nexbank.transfers.idempotency_key
+    async def transfer_request_otp(self, from_account, to_account, amount):
+        return await self.post("/transfer/request-otp", params={
+            "fromAccount": from_account,
+            "toAccount": to_account,
+            "amount": amount
+        })
+
+    async def transfer(self, token, payload, key):
+        return await self.post("/transfer", json=payload, headers={
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json",
+            "Idempotency-Key": key
+        })
+
+    # History and balance
+    async def transaction_history(self, token, accnumber, **kwargs):
+        from nexbank import history
+        return await self._call(history.fetch_history, token, accnumber, **kwargs)
+
+    async def balance(self, token, accnumber, etag=None):
+        from nexbank import balance
+        headers = {"Authorization": f"Bearer {token}"}
+        if etag:
+            headers["If-None-Match"] = etag
+        return await self.get(balance.BALANCE_PATH, headers=headers, params={"accountNumber": accnumber})
+
+    # Statements
+    async def send_statement(self, token, accnumber, month, year):
+        return await self.post("/send-statement", headers={
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/x-www-form-urlencoded"
+        }, data={"accountNumber": accnumber, "month": month, "year": year})
+
+    # Stop the worker threads once the calls in flight have finished
+    def close(self):
+        self._executor.shutdown(wait=True)
+
+
+_loop = None
+_client = None
+_lock = threading.Lock()
+
+
+# Process-wide event loop, running on its own daemon thread
+def get_loop():
+    global _loop
+    if _loop is None:
+        with _lock:
+            if _loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="nexbank-async-loop", daemon=True).start()
+                _loop = loop
+    return _loop
+
+
+# Process-wide client shared by every session
+def get_client():
+    global _client
+    if _client is None:
+        with _lock:
+            if _client is None:
+                _client = AsyncBackend()
+    return _client
+
+
+# Schedule a coroutine on the process-wide loop; returns a concurrent.futures.Future
+def submit(coro):
+    return asyncio.run_coroutine_threadsafe(coro, get_loop())
+
+
+# Run a coroutine on the process-wide loop and wait for its result
+def run(coro, timeout=None):
+    return submit(coro).result(timeout)
+
+
+async def _gather(coros, return_exceptions):
+    return await asyncio.gather(*coros, return_exceptions=return_exceptions)
+
+
+# Run coroutines concurrently and return their results in order; failures are returned
+# in place of results unless return_exceptions is False
+def run_all(coros, return_exceptions=True, timeout=None):
+    return run(_gather(list(coros), return_exceptions), timeout)
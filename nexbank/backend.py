@@ -0,0 +1,277 @@
+import os
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from nexbank import circuit_breaker, metrics
+
+BACKEND_URL = os.environ.get("NEXBANK_BACKEND_URL", "https://state-bank-of-india.onrender.com").rstrip("/")
+# Backend instances as a comma-separated list; falls back to the single BACKEND_URL
+BACKEND_URLS = [
+    url.strip().rstrip("/") for url in os.environ.get("NEXBANK_BACKEND_URLS", "").split(",") if url.strip()
+] or [BACKEND_URL]
+
+# Health checks: any response below 500 from HEALTH_PATH counts as healthy, and its
+# round trip time ranks the instance. Only run when more than one instance is configured.
+HEALTH_PATH = os.environ.get("NEXBANK_HEALTH_PATH", "/")
+HEALTH_INTERVAL = float(os.environ.get("NEXBANK_HEALTH_INTERVAL", "30"))
+HEALTH_TIMEOUT = (3.0, 10.0)
+# Idempotent reads that move to the next instance when one cannot be reached
+FAILOVER_PATHS = frozenset(["/get-transaction-history", "/get-security-question", "/get-balance"])
+
+# Connection pool sizing; one pool is shared by every Streamlit session in the process
+POOL_CONNECTIONS = int(os.environ.get("NEXBANK_POOL_CONNECTIONS", "4"))
+POOL_MAXSIZE = int(os.environ.get("NEXBANK_POOL_MAXSIZE", "32"))
+POOL_BLOCK = os.environ.get("NEXBANK_POOL_BLOCK", "0") == "1"
+
+# Retry with exponential backoff (backoff_factor * 2 ** (retry - 1) seconds)
+MAX_RETRIES = int(os.environ.get("NEXBANK_MAX_RETRIES", "2"))
+BACKOFF_FACTOR = float(os.environ.get("NEXBANK_BACKOFF_FACTOR", "0.3"))
+RETRY_STATUSES = (502, 503, 504)
+
+# (connect, read) timeouts in seconds
+DEFAULT_TIMEOUT = (5.0, 30.0)
+ENDPOINT_TIMEOUTS = {
+    "/register/init": (5.0, 30.0),
+    "/register/complete": (5.0, 30.0),
+    "/login/request-otp": (5.0, 30.0),
+    "/login/verify": (5.0, 20.0),
+    "/get-security-question": (5.0, 15.0),
+    "/verify-security-answer": (5.0, 30.0),
+    "/reset-password": (5.0, 20.0),
+    "/transfer/request-otp": (5.0, 30.0),
+    "/transfer": (5.0, 45.0),
+    "/get-transaction-history": (5.0, 30.0),
+    "/get-balance": (5.0, 10.0),
+    "/send-statement": (5.0, 60.0),
+}
+
+_session = None
+_session_lock = threading.Lock()
+
+
+class Instance:
+    """One backend base URL with its last health check result."""
+
+    __slots__ = ("url", "healthy", "latency", "checked_at")
+
+    def __init__(self, url):
+        self.url = url
+        self.healthy = True
+        self.latency = None  # seconds, from the last successful health check
+        self.checked_at = 0.0
+
+
+_instances = [Instance(url) for url in BACKEND_URLS]
+_health_lock = threading.Lock()
+_health_running = False
+_last_health_check = 0.0
+
+
+def _build_session():
+    # Connect errors are retried for every method (nothing reached the server);
+    # read and status retries only apply to idempotent methods
+    retry = Retry(
+        total=MAX_RETRIES,
+        connect=MAX_RETRIES,
+        read=MAX_RETRIES,
+        status=MAX_RETRIES,
+        backoff_factor=BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset(["GET", "HEAD", "OPTIONS"]),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        pool_block=POOL_BLOCK,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"Connection": "keep-alive"})
+    return session
+
+
+# Process-wide pooled session reused by all Streamlit sessions
+def get_session():
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _build_session()
+    return _session
+
+
+# Drop the pooled session (closing its sockets); the next call builds a fresh one
+def reset_session():
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+        _session = None
+
+
+# Probe one instance and record whether it answered and how quickly
+def check_health(instance, timeout=HEALTH_TIMEOUT):
+    start = time.perf_counter()
+    try:
+        response = get_session().get(f"{instance.url}{HEALTH_PATH}", timeout=timeout)
+        instance.healthy = response.status_code < 500
+        instance.latency = time.perf_counter() - start if instance.healthy else None
+    except requests.exceptions.RequestException:
+        instance.healthy = False
+        instance.latency = None
+    instance.checked_at = time.monotonic()
+    return instance.healthy
+
+
+# Probe every instance in parallel and wait for the results; `connections` probes per
+# instance run at once, leaving that many warm sockets in the pool. True if any is healthy.
+def check_all(timeout=HEALTH_TIMEOUT, connections=1):
+    threads = [
+        threading.Thread(target=check_health, args=(instance, timeout), daemon=True)
+        for instance in _instances
+        for _ in range(connections)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return any(instance.healthy for instance in _instances)
+
+
+def _run_health_checks():
+    global _health_running
+    try:
+        check_all()
+    finally:
+        with _health_lock:
+            _health_running = False
+
+
+# Start a background health check when the last one is older than HEALTH_INTERVAL;
+# requests never wait for it
+def _maybe_check_health():
+    global _health_running, _last_health_check
+    if len(_instances) < 2 or time.monotonic() - _last_health_check < HEALTH_INTERVAL:
+        return
+    with _health_lock:
+        if _health_running or time.monotonic() - _last_health_check < HEALTH_INTERVAL:
+            return
+        _health_running = True
+        _last_health_check = time.monotonic()
+    threading.Thread(target=_run_health_checks, name="nexbank-health", daemon=True).start()
+
+
+# Instances in the order they should be tried: healthy before unhealthy, then by
+# measured latency; instances not measured yet keep their configured order
+def ranked_instances():
+    return sorted(
+        _instances,
+        key=lambda instance: (not instance.healthy, float("inf") if instance.latency is None else instance.latency)
+    )
+
+
+def endpoint_timeout(path):
+    return ENDPOINT_TIMEOUTS.get(path, DEFAULT_TIMEOUT)
+
+
+# Count JSON decode failures against the endpoint; callers still see the ValueError
+def _instrument_json(response, path):
+    decode = response.json
+
+    def json(**kwargs):
+        try:
+            return decode(**kwargs)
+        except ValueError:
+            metrics.record_error(path, "json_decode")
+            raise
+
+    response.json = json
+
+
+# Send a request to the backend through the shared pool. The endpoint's circuit breaker
+# is consulted first, and fed the outcome: timeouts, connection errors and 5xx responses
+# count as failures. The best ranked instance is used; reads in FAILOVER_PATHS move on
+# to the next instance on a connection error.
+def request(method, path, **kwargs):
+    kwargs.setdefault("timeout", endpoint_timeout(path))
+    breaker = circuit_breaker.get_breaker(path)
+    try:
+        breaker.before_call()
+    except circuit_breaker.CircuitOpenError:
+        metrics.record_error(path, "circuit_open")
+        raise
+    try:
+        response = _request(method, path, **kwargs)
+    except requests.exceptions.RequestException:
+        breaker.record_failure()
+        raise
+    except BaseException:
+        breaker.release()
+        raise
+    if response.status_code >= 500:
+        breaker.record_failure()
+    else:
+        breaker.record_success()
+    return response
+
+
+def _request(method, path, **kwargs):
+    _maybe_check_health()
+    candidates = ranked_instances()
+    if path not in FAILOVER_PATHS:
+        candidates = candidates[:1]
+    for instance in candidates[:-1]:
+        try:
+            return _send(instance, method, path, **kwargs)
+        except requests.exceptions.ConnectionError:
+            _mark_down(instance)
+    try:
+        return _send(candidates[-1], method, path, **kwargs)
+    except requests.exceptions.ConnectionError:
+        _mark_down(candidates[-1])
+        raise
+
+
+# Rank an unreachable instance last until the next health check; a lone instance has
+# nothing to fall back to, so it is left alone
+def _mark_down(instance):
+    if len(_instances) > 1:
+        instance.healthy = False
+
+
+# One attempt against one instance, recording latency, status and failures in
+# nexbank.metrics
+def _send(instance, method, path, **kwargs):
+    start = time.perf_counter()
+    try:
+        response = get_session().request(method, f"{instance.url}{path}", **kwargs)
+    except requests.exceptions.Timeout:
+        metrics.record_request(path, method, time.perf_counter() - start)
+        metrics.record_error(path, "timeout")
+        raise
+    except requests.exceptions.ConnectionError:
+        metrics.record_request(path, method, time.perf_counter() - start)
+        metrics.record_error(path, "connection")
+        raise
+    except requests.exceptions.RequestException:
+        metrics.record_request(path, method, time.perf_counter() - start)
+        metrics.record_error(path, "other")
+        raise
+    metrics.record_request(path, method, time.perf_counter() - start, response.status_code)
+    _instrument_json(response, path)
+    return response
+
+
+def get(path, **kwargs):
+    return request("GET", path, **kwargs)
+
+
+def post(path, **kwargs):
+    return request("POST", path, **kwargs)
@@ -0,0 +1,126 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests.exceptions
+
+from nexbank import backend
+from nexbank.transfers import balance_from_response
+
+# Server-authoritative balance per account, refreshed in the background once it is older
+# than BALANCE_TTL. Refreshes are conditional: the ETag of the last response is sent as
+# If-None-Match, so an unchanged balance costs a 304 with no body.
+
+BALANCE_PATH = os.environ.get("NEXBANK_BALANCE_PATH", "/get-balance")
+BALANCE_TTL = float(os.environ.get("NEXBANK_BALANCE_TTL", "15"))
+# Worker threads shared by every Streamlit session in the process
+BALANCE_WORKERS = int(os.environ.get("NEXBANK_BALANCE_WORKERS", "4"))
+
+_executor = None
+_lock = threading.Lock()
+# False once the backend answered BALANCE_PATH with 404/405; the balance then only
+# changes through login and transfer responses
+_supported = None
+
+
+class BalanceEntry:
+    __slots__ = ("balance", "etag", "fetched_at", "refreshing", "error")
+
+    def __init__(self, balance):
+        self.balance = balance
+        self.etag = None
+        self.fetched_at = time.monotonic()
+        self.refreshing = False
+        self.error = None
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        with _lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=BALANCE_WORKERS,
+                                               thread_name_prefix="balance-refresh")
+    return _executor
+
+
+# True while the backend may serve live balances (unknown counts as yes)
+def live():
+    return _supported is not False
+
+
+# Store a balance the server just reported (login or transfer response) as fresh
+def seed(cache, accnumber, value):
+    entry = cache.get(accnumber)
+    if entry is None:
+        cache[accnumber] = BalanceEntry(value)
+    else:
+        entry.balance = value
+        entry.fetched_at = time.monotonic()
+
+
+# Mark the cached balance stale so the next read starts a full (unconditional) refresh;
+# `provisional` is shown until that refresh lands
+def invalidate(cache, accnumber, provisional=None):
+    entry = cache.get(accnumber)
+    if entry is None:
+        return
+    if provisional is not None:
+        entry.balance = provisional
+    entry.etag = None
+    entry.fetched_at = 0.0
+
+
+# Fetch the balance now, conditionally on the cached ETag; runs on a worker thread or the
+# dashboard prefetch. Errors are kept on the entry and retried after another BALANCE_TTL.
+def refresh(cache, token, accnumber):
+    global _supported
+    entry = cache.get(accnumber)
+    if entry is None:
+        entry = cache[accnumber] = BalanceEntry(None)
+    headers = {"Authorization": f"Bearer {token}"}
+    if entry.etag:
+        headers["If-None-Match"] = entry.etag
+    try:
+        response = backend.get(BALANCE_PATH, headers=headers, params={"accountNumber": accnumber})
+        if response.status_code in (404, 405):
+            _supported = False
+            return entry.balance
+        if response.status_code != 304:
+            response.raise_for_status()
+            value = balance_from_response(response.json())
+            if value is None:
+                raise ValueError("no balance in response")
+            entry.balance = value
+            entry.etag = response.headers.get("ETag")
+        _supported = True
+        entry.error = None
+    except requests.exceptions.RequestException as e:
+        entry.error = f"Balance refresh failed: {str(e)}"
+    except ValueError as e:
+        entry.error = f"Balance refresh failed: Invalid response: {str(e)}"
+    finally:
+        entry.fetched_at = time.monotonic()
+        entry.refreshing = False
+    return entry.balance
+
+
+def _refresh_in_background(cache, token, accnumber):
+    entry = cache[accnumber]
+    with _lock:
+        if entry.refreshing:
+            return
+        entry.refreshing = True
+    _get_executor().submit(refresh, cache, token, accnumber)
+
+
+# Cached balance for an account, returned straight away; a stale one is refreshed in the
+# background and the new value shows up on a later read
+def current(cache, token, accnumber):
+    entry = cache.get(accnumber)
+    if entry is None:
+        return None
+    if live() and time.monotonic() - entry.fetched_at >= BALANCE_TTL:
+        _refresh_in_background(cache, token, accnumber)
+    return entry.balance
@@ -0,0 +1,407 @@
+import asyncio
+import glob
+import hashlib
+import io
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+import uuid
+
+import pandas as pd
+import requests.exceptions
+
+from nexbank import async_backend, transfers
+
+# Bulk transfers from an uploaded CSV of payees. The file is validated as a whole, one
+# transfer OTP is requested for the batch total, and the rows are sent as separate
+# /transfer calls (the backend has no batch endpoint) through the async client, at most
+# BULK_CONCURRENCY at a time per batch.
+#
+# A batch is identified by the account and a digest of the CSV, and every run of it gets
+# a random run id when it first starts. Each finished row is appended to a checkpoint
+# file for that run, so uploading the same file while its run is unfinished resumes it:
+# rows already sent are never sent twice. Every row carries an idempotency key derived
+# from the run id as well, so a row whose outcome was lost is also matched by the backend
+# when it is retried. Once every row is sent the run is closed, and later uploads of the
+# same file are reported as sent; sending it again (the next pay run) takes an explicit
+# start_over(), which starts a new run with new keys.
+
+# Transfers in flight at once per batch
+BULK_CONCURRENCY = int(os.environ.get("NEXBANK_BULK_CONCURRENCY", "4"))
+# Most payee rows accepted in one file
+BULK_MAX_ROWS = int(os.environ.get("NEXBANK_BULK_MAX_ROWS", "1000"))
+# Where checkpoints are kept; they hold account numbers and amounts, never OTPs or tokens
+CHECKPOINT_DIR = os.environ.get("NEXBANK_BULK_CHECKPOINT_DIR",
+                                os.path.join(tempfile.gettempdir(), "nexbank-bulk-transfers"))
+# Seconds a batch that is no longer running stays in memory; its checkpoint stays on disk
+BATCH_RETENTION = 3600
+
+ACCOUNT_PATTERN = re.compile(r'^\d{4,20}$')
+# Accepted spellings of the two columns, compared lowercased without spaces or underscores
+COLUMN_NAMES = {
+    "to_account": ("toaccount", "account", "accountnumber", "payee", "payeeaccount"),
+    "amount": ("amount",),
+}
+
+PENDING = "pending"
+SENT = "sent"
+FAILED = "failed"
+
+IDLE = "idle"
+RUNNING = "running"
+PAUSED = "paused"
+FINISHED = "finished"
+
+
+class BulkFileError(Exception):
+    pass
+
+
+class Validation:
+    """Parsed payee rows with one error message per row ("" when the row is fine)."""
+
+    __slots__ = ("digest", "rows", "amount_text", "errors", "total")
+
+    def __init__(self, digest, rows, amount_text, errors, total):
+        self.digest = digest
+        self.rows = rows
+        self.amount_text = amount_text
+        self.errors = errors
+        self.total = total
+
+    # Rows with a problem, amounts as written in the file
+    @property
+    def invalid(self):
+        bad = self.errors != ""
+        return self.rows[bad].assign(amount=self.amount_text[bad], error=self.errors[bad])
+
+
+def _column_for(names, accepted):
+    for name in names:
+        if name.lower().replace(" ", "").replace("_", "") in accepted:
+            return name
+    return None
+
+
+# Parse and validate an uploaded CSV for the sender's account; the total is checked
+# against the balance by the caller, net of rows already sent. Raises BulkFileError when
+# the file as a whole cannot be used.
+def validate(data, from_account):
+    try:
+        frame = pd.read_csv(io.BytesIO(data), dtype=str, keep_default_na=False)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise BulkFileError(f"Could not read the CSV file: {str(e)}")
+    columns = {}
+    for column, accepted in COLUMN_NAMES.items():
+        columns[column] = _column_for(frame.columns, accepted)
+        if columns[column] is None:
+            raise BulkFileError(f"The CSV file needs a '{column}' column.")
+    if frame.empty:
+        raise BulkFileError("The CSV file has no payee rows.")
+    if len(frame) > BULK_MAX_ROWS:
+        raise BulkFileError(f"The CSV file has {len(frame):,} rows; at most {BULK_MAX_ROWS:,} are allowed.")
+
+    to_account = frame[columns["to_account"]].str.strip()
+    raw_amount = frame[columns["amount"]].str.strip()
+    amount = pd.to_numeric(raw_amount, errors="coerce")
+    cents = amount * 100
+    errors = pd.Series("", index=frame.index, dtype=object)
+    # Checked in reverse order of importance, so the first problem in a row is the one kept
+    errors[(cents - cents.round()).abs() > 1e-6] = "Amount has more than 2 decimal places"
+    errors[~(amount > 0)] = "Amount must be greater than 0"
+    errors[amount.isna()] = "Amount is not a number"
+    errors[to_account == str(from_account)] = "Cannot transfer to your own account"
+    errors[~to_account.str.match(ACCOUNT_PATTERN.pattern)] = "Invalid account number"
+
+    rows = pd.DataFrame({
+        # CSV line numbers, the header being line 1
+        "row": frame.index.to_numpy() + 2,
+        "to_account": to_account,
+        "amount": amount,
+    })
+    digest = hashlib.sha256(f"{from_account}|".encode("utf-8") + data).hexdigest()
+    return Validation(digest, rows, raw_amount, errors, float(rows["amount"][errors == ""].sum()))
+
+
+class Batch:
+    """One uploaded file being sent: per-row status and message, and the checkpoint path."""
+
+    __slots__ = ("id", "from_account", "rows", "status", "messages", "state", "message",
+                 "unapplied", "finished_at", "run_id", "closed", "lock")
+
+    def __init__(self, digest, from_account, rows):
+        self.id = digest[:32]
+        self.from_account = str(from_account)
+        self.rows = rows.reset_index(drop=True)
+        self.status = [PENDING] * len(rows)
+        self.messages = [""] * len(rows)
+        self.state = IDLE
+        self.message = ""
+        self.unapplied = 0.0  # amount sent that the session balance does not reflect yet
+        self.finished_at = time.time()
+        self.run_id = None  # set when the run first starts
+        self.closed = False  # every row sent, or replaced by a new run of the file
+        self.lock = threading.Lock()
+
+    @property
+    def path(self):
+        return _checkpoint_path(self.from_account, self.id, self.run_id)
+
+    def counts(self):
+        with self.lock:
+            return {status: self.status.count(status) for status in (PENDING, SENT, FAILED)}
+
+    @property
+    def sent_total(self):
+        with self.lock:
+            return float(sum(amount for amount, status in zip(self.rows["amount"], self.status)
+                             if status == SENT))
+
+    def key(self, position):
+        return transfers.idempotency_key(self.from_account, self.rows["to_account"].iat[position],
+                                         self.rows["amount"].iat[position], f"bulk-{self.run_id}-{position}")
+
+    # Rows still to send: never tried, failed or interrupted
+    def unsent(self):
+        with self.lock:
+            return [position for position, status in enumerate(self.status) if status != SENT]
+
+    def record(self, position, status, message):
+        with self.lock:
+            self.status[position] = status
+            self.messages[position] = message
+            if status == SENT:
+                self.unapplied += float(self.rows["amount"].iat[position])
+        _append_checkpoint(self, {"position": position, "status": status, "message": message})
+
+    # Amount sent since the last call, for the session to take off its balance once
+    def take_unapplied(self):
+        with self.lock:
+            amount, self.unapplied = self.unapplied, 0.0
+        return amount
+
+    # Per-row outcome as a CSV file
+    def results_csv(self):
+        with self.lock:
+            frame = pd.DataFrame({
+                "Row": self.rows["row"],
+                "To Account": self.rows["to_account"],
+                "Amount": self.rows["amount"],
+                "Status": self.status,
+                "Message": self.messages,
+            })
+        return frame.to_csv(index=False).encode("utf-8")
+
+    # Rows that have an outcome, in file order
+    def finished_rows(self):
+        with self.lock:
+            done = [position for position, status in enumerate(self.status) if status != PENDING]
+            return pd.DataFrame({
+                "Row": self.rows["row"].to_numpy()[done],
+                "To Account": self.rows["to_account"].to_numpy()[done],
+                "Amount": self.rows["amount"].to_numpy()[done],
+                "Status": [self.status[position] for position in done],
+                "Message": [self.messages[position] for position in done],
+            })
+
+
+def _checkpoint_path(from_account, batch_id, run_id):
+    return os.path.join(CHECKPOINT_DIR, f"{from_account}-{batch_id}-{run_id}.jsonl")
+
+
+def _append_checkpoint(batch, entry):
+    os.makedirs(CHECKPOINT_DIR, mode=0o700, exist_ok=True)
+    descriptor = os.open(batch.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+    with os.fdopen(descriptor, "a", encoding="utf-8") as f:
+        f.write(json.dumps(entry) + "\n")
+
+
+def _read_checkpoint(path):
+    entries = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue  # a line cut short by a crash
+            if isinstance(entry, dict):
+                entries.append(entry)
+    return entries
+
+
+# Restore the batch from the checkpoints of earlier runs of the same file: the newest
+# unfinished run is resumed; failing that, the newest closed run is shown as closed, so a
+# file sent before is only sent again through start_over(). The first line of a
+# checkpoint names its run and later lines win.
+def _load_checkpoint(batch):
+    paths = glob.glob(_checkpoint_path(batch.from_account, batch.id, "*"))
+    closed_run = None
+    for path in sorted(paths, key=os.path.getmtime, reverse=True):
+        try:
+            entries = _read_checkpoint(path)
+        except OSError:
+            continue
+        if not entries or not isinstance(entries[0].get("run"), str):
+            continue
+        if any("closed" in entry for entry in entries):
+            closed_run = closed_run or entries
+            continue
+        _apply_checkpoint(batch, entries)
+        if all(status == SENT for status in batch.status):
+            # The process stopped after the last row but before closing the run
+            _close(batch, "finished")
+        return
+    if closed_run is not None:
+        _apply_checkpoint(batch, closed_run)
+        batch.closed = True
+
+
+def _apply_checkpoint(batch, entries):
+    batch.run_id = entries[0]["run"]
+    for entry in entries[1:]:
+        try:
+            position = int(entry["position"])
+        except (ValueError, KeyError, TypeError):
+            continue
+        if 0 <= position < len(batch.status):
+            batch.status[position] = entry.get("status", PENDING)
+            batch.messages[position] = entry.get("message", "")
+
+
+# Mark the batch's run as done so an upload of the same file starts a new run
+def _close(batch, reason):
+    batch.closed = True
+    if batch.run_id is not None:
+        _append_checkpoint(batch, {"closed": reason})
+
+
+_batches = {}
+_lock = threading.Lock()
+
+
+def _prune(now):
+    for batch_id in [batch_id for batch_id, batch in _batches.items()
+                     if batch.state != RUNNING and now - batch.finished_at > BATCH_RETENTION]:
+        del _batches[batch_id]
+
+
+# The batch for a validated file, resumed from its checkpoint if a run of it is
+# unfinished, or closed if the file was sent before
+def get_batch(validation, from_account):
+    with _lock:
+        _prune(time.time())
+        batch_id = validation.digest[:32]
+        batch = _batches.get(batch_id)
+        if batch is None or batch.from_account != str(from_account):
+            batch = Batch(validation.digest, from_account, validation.rows)
+            _load_checkpoint(batch)
+            _batches[batch_id] = batch
+    return batch
+
+
+# A new batch for the same file, to send every row again (e.g. the next pay run); the
+# current run, if any, is closed and will not be resumed. Returns the running batch
+# unchanged while it is still sending.
+def start_over(validation, from_account):
+    with _lock:
+        batch_id = validation.digest[:32]
+        batch = _batches.get(batch_id)
+        if batch is not None and batch.from_account == str(from_account):
+            with batch.lock:
+                if batch.state == RUNNING:
+                    return batch
+                if not batch.closed:
+                    _close(batch, "replaced")
+        batch = Batch(validation.digest, from_account, validation.rows)
+        _batches[batch_id] = batch
+    return batch
+
+
+def find_batch(batch_id, from_account):
+    batch = _batches.get(batch_id)
+    if batch is None or batch.from_account != str(from_account):
+        return None
+    return batch
+
+
+def _error_message(response, default):
+    try:
+        return response.json().get("message", default)
+    except ValueError:
+        return "Invalid response from server."
+
+
+def _stop(batch, message):
+    with batch.lock:
+        if batch.state == RUNNING:
+            batch.state = PAUSED
+            batch.message = message
+
+
+async def _send_row(client, semaphore, batch, position, token, otp):
+    async with semaphore:
+        if batch.state != RUNNING:
+            return
+        payload = {
+            "fromAccount": batch.from_account,
+            "toAccount": batch.rows["to_account"].iat[position],
+            "amount": float(batch.rows["amount"].iat[position]),
+            "otp": otp
+        }
+        try:
+            response = await client.transfer(token, payload, batch.key(position))
+            response.raise_for_status()
+            response_data = response.json()
+            if response_data.get("status") == "success":
+                batch.record(position, SENT, response_data.get("message", "Transfer complete"))
+            else:
+                batch.record(position, FAILED, f"Transfer failed: {response_data.get('message', 'Unknown error')}")
+        except requests.exceptions.HTTPError as e:
+            message = _error_message(e.response, "Unknown error") if e.response.status_code == 400 else str(e)
+            if e.response.status_code in (401, 403) or "otp" in message.lower():
+                # Every later row would be refused the same way; stop and let the user
+                # resume with a fresh OTP
+                _stop(batch, f"Bulk transfer paused: {message}")
+            elif "fraudulent" in message.lower():
+                batch.record(position, FAILED, "Transaction failed: Fraud detected by ML model.")
+            else:
+                batch.record(position, FAILED, f"Transfer failed: {message}")
+        except requests.exceptions.RequestException as e:
+            # The outcome is unknown; the row stays unsent and its idempotency key makes
+            # the retry safe
+            _stop(batch, f"Bulk transfer paused: {str(e)}")
+        except ValueError as e:
+            batch.record(position, FAILED, f"Transfer failed: Invalid JSON response: {str(e)}")
+
+
+async def _run(batch, token, otp):
+    client = async_backend.get_client()
+    semaphore = asyncio.Semaphore(BULK_CONCURRENCY)
+    try:
+        await asyncio.gather(*(_send_row(client, semaphore, batch, position, token, otp)
+                               for position in batch.unsent()))
+    finally:
+        with batch.lock:
+            if batch.state == RUNNING:
+                batch.state = FINISHED
+            batch.finished_at = time.time()
+            if all(status == SENT for status in batch.status):
+                _close(batch, "finished")
+
+
+# Send every row not sent yet with the batch OTP; False if the batch is already running
+# or closed. The first start gives the batch its run id.
+def start(batch, token, otp):
+    with batch.lock:
+        if batch.state == RUNNING or batch.closed:
+            return False
+        if batch.run_id is None:
+            batch.run_id = uuid.uuid4().hex
+            _append_checkpoint(batch, {"run": batch.run_id})
+        batch.state = RUNNING
+        batch.message = ""
+    async_backend.submit(_run(batch, token, otp))
+    return True
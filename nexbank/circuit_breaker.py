@@ -0,0 +1,101 @@
+import os
+import threading
+import time
+
+import requests
+
+# Per-endpoint circuit breakers for backend calls. After BREAKER_FAILURES consecutive
+# failures (timeouts, connection errors, 5xx responses) an endpoint's breaker opens and
+# calls fail at once with CircuitOpenError instead of each holding a script thread for
+# a full timeout. After BREAKER_RESET seconds one half-open probe is let through: its
+# success closes the breaker, its failure opens it for another BREAKER_RESET seconds.
+
+BREAKER_FAILURES = int(os.environ.get("NEXBANK_BREAKER_FAILURES", "5"))
+BREAKER_RESET = float(os.environ.get("NEXBANK_BREAKER_RESET", "30"))
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised instead of calling an endpoint whose breaker is open.
+
+    A ConnectionError, so the views' existing RequestException handlers report it.
+    """
+
+    def __init__(self, path, retry_in):
+        super().__init__(f"the server is not responding to {path}; "
+                         f"please try again in {max(1, round(retry_in))} seconds")
+        self.path = path
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """Consecutive-failure breaker for one endpoint, shared by every session."""
+
+    __slots__ = ("path", "state", "failures", "opened_at", "probing", "lock")
+
+    def __init__(self, path):
+        self.path = path
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probing = False  # a half-open probe is in flight
+        self.lock = threading.Lock()
+
+    # Let a call through or raise CircuitOpenError; once the reset time has passed,
+    # the first caller becomes the half-open probe and the others keep failing fast
+    def before_call(self):
+        with self.lock:
+            if self.state == CLOSED:
+                return
+            retry_in = self.opened_at + BREAKER_RESET - time.monotonic()
+            if retry_in > 0 or self.probing:
+                raise CircuitOpenError(self.path, max(retry_in, 0))
+            self.state = HALF_OPEN
+            self.probing = True
+
+    def record_success(self):
+        with self.lock:
+            self.state = CLOSED
+            self.failures = 0
+            self.probing = False
+
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            self.probing = False
+            if self.state == HALF_OPEN or self.failures >= BREAKER_FAILURES:
+                self.state = OPEN
+                self.opened_at = time.monotonic()
+
+    # The call ended without an outcome (e.g. the script was stopped); free the probe slot
+    def release(self):
+        with self.lock:
+            if self.probing:
+                self.probing = False
+                self.state = OPEN
+
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(path):
+    breaker = _breakers.get(path)
+    if breaker is None:
+        with _breakers_lock:
+            breaker = _breakers.setdefault(path, CircuitBreaker(path))
+    return breaker
+
+
+# Current state of every endpoint's breaker: {path: state}
+def states():
+    with _breakers_lock:
+        return {path: breaker.state for path, breaker in _breakers.items()}
+
+
+def reset():
+    with _breakers_lock:
+        _breakers.clear()
@@ -0,0 +1,294 @@
+import codecs
+import json
+import os
+import re
+import time
+from collections import Counter
+
+import pandas as pd
+
+from nexbank import backend, history_parser
+
+# Seconds a cached history stays fresh before the next view triggers an incremental fetch
+HISTORY_TTL = float(os.environ.get("NEXBANK_HISTORY_TTL", "60"))
+# Rows sent to the browser at a time; older rows are paged in on demand
+PAGE_SIZE = int(os.environ.get("NEXBANK_HISTORY_WINDOW", "500"))
+# Rows per backend page; 0 fetches the history in a single request
+SERVER_PAGE_SIZE = int(os.environ.get("NEXBANK_HISTORY_SERVER_PAGE_SIZE", "0"))
+
+# Bytes read from the response body at a time, and table lines parsed per batch, while
+# a history is streamed in
+STREAM_CHUNK_BYTES = 64 * 1024
+STREAM_BATCH_LINES = 20000
+
+EXPECTED_COLUMNS = history_parser.COLUMNS
+DISPLAY_COLUMNS = {
+    "date": "Date",
+    "fromAccount": "From Account",
+    "toAccount": "To Account",
+    "amount": "Amount",
+    "status": "Status",
+}
+
+class HistoryFormatError(ValueError):
+    pass
+
+
+# Parse a history payload (pipe-delimited table or JSON list) into the typed frame;
+# rows the parser rejects are returned alongside so the view can report them
+def parse_history(history_data):
+    if isinstance(history_data, str):
+        parsed = history_parser.parse_history_table(history_data)
+    elif isinstance(history_data, list):
+        try:
+            parsed = history_parser.parse_history_records(history_data)
+        except ValueError as e:
+            raise HistoryFormatError(str(e))
+    else:
+        raise HistoryFormatError(
+            f"Invalid data format. Expected a list or string, got {type(history_data)}.")
+    return parsed.frame, parsed.malformed
+
+
+_HISTORY_KEY = re.compile(r'"history"\s*:\s*')
+# An escape cut off by the end of a chunk; a high surrogate is held back too so it is
+# decoded together with its low half
+_PARTIAL_ESCAPE = re.compile(
+    r'\\u[dD][89abAB][0-9a-fA-F]{2}(?:\\(?:u[0-9a-fA-F]{0,3})?)?$|\\(?:u[0-9a-fA-F]{0,3})?$')
+
+
+# Decoded text of the response body, one chunk at a time
+def _body_text(response):
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    for chunk in response.iter_content(chunk_size=STREAM_CHUNK_BYTES):
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+def _backslashes_before(text, position):
+    count = 0
+    while position > count and text[position - count - 1] == "\\":
+        count += 1
+    return count
+
+
+# Position of the quote closing a JSON string in `text`, or -1
+def _closing_quote(text):
+    position = text.find('"')
+    while position != -1 and _backslashes_before(text, position) % 2:
+        position = text.find('"', position + 1)
+    return position
+
+
+# Length of the prefix of `text` that ends on a whole escape and can be decoded now
+def _decodable_length(text):
+    # Only the last few characters can belong to an unfinished escape; a match that starts
+    # on an escaped backslash is not one, but a shorter match after it may be
+    match = _PARTIAL_ESCAPE.search(text, max(0, len(text) - 13))
+    while match is not None and _backslashes_before(text, match.start()) % 2:
+        match = _PARTIAL_ESCAPE.search(text, match.start() + 1)
+    return len(text) if match is None else match.start()
+
+
+# Yield the "history" table of a JSON body as decoded text pieces while the body arrives,
+# without holding the body or the whole table in memory. A body whose history is not a
+# string (a JSON list, or missing) is read whole and its history returned, in a 1-tuple,
+# as the generator's value instead.
+def _stream_table_text(chunks):
+    buffer = ""
+    for text in chunks:
+        buffer += text
+        match = _HISTORY_KEY.search(buffer)
+        if match and match.end() < len(buffer):
+            break
+    else:
+        return (json.loads(buffer).get("history"),)
+    if buffer[match.end()] != '"':
+        return (json.loads(buffer + "".join(chunks)).get("history"),)
+
+    pending = buffer[match.end() + 1:]
+    while True:
+        end = _closing_quote(pending)
+        if end != -1:
+            yield json.loads(f'"{pending[:end]}"')
+            return None
+        cut = _decodable_length(pending)
+        yield json.loads(f'"{pending[:cut]}"')
+        text = next(chunks, None)
+        if text is None:
+            raise HistoryFormatError("History response ended in the middle of the table.")
+        pending = pending[cut:] + text
+
+
+def _parse_batch(header, lines, first_line_number):
+    parsed = history_parser.parse_history_table("\n".join([header] + lines))
+    # The parser numbers lines from the header (line 1); map back to the whole table
+    offset = first_line_number - 2
+    malformed = [row._replace(line_number=row.line_number + offset) for row in parsed.malformed]
+    return parsed.frame, malformed
+
+
+# Parse the streamed table in batches of STREAM_BATCH_LINES, so only one batch of raw text
+# is held at a time next to the typed frames built so far. Line numbers in malformed rows
+# count from the header, as for a table parsed in one piece.
+def _parse_streamed(pieces, on_progress=None):
+    header = None
+    frames = []
+    malformed = []
+    batch = []
+    batch_start = 2  # line number of batch[0]
+    carry = ""
+    try:
+        while True:
+            lines = (carry + next(pieces)).split("\n")
+            carry = lines.pop()
+            if header is None:
+                while lines and not lines[0].strip():
+                    lines.pop(0)
+                if not lines:
+                    continue
+                header = lines.pop(0)
+            batch.extend(lines)
+            if len(batch) >= STREAM_BATCH_LINES:
+                frame, rejected = _parse_batch(header, batch, batch_start)
+                frames.append(frame)
+                malformed.extend(rejected)
+                batch_start += len(batch)
+                batch = []
+                if on_progress:
+                    on_progress(sum(map(len, frames)))
+    except StopIteration as stop:
+        if stop.value is not None:
+            # Not a streamable table; parse the payload the usual way
+            return parse_history(stop.value[0])
+    if header is None:
+        if not carry.strip():
+            return history_parser.empty_frame(), []
+        header = carry
+    elif carry:
+        batch.append(carry)
+    if batch or not frames:
+        frame, rejected = _parse_batch(header, batch, batch_start)
+        frames.append(frame)
+        malformed.extend(rejected)
+    if on_progress:
+        on_progress(sum(map(len, frames)))
+    return pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0], malformed
+
+
+# Request one page of history; `since` and the paging parameters let a backend that
+# supports them return only the rows we do not hold yet. The body is streamed and parsed
+# as it arrives; `on_progress(rows)` is called as batches of rows are parsed.
+def fetch_history(token, accnumber, since=None, page=None, page_size=None, on_progress=None):
+    params = {"accountNumber": accnumber}
+    if since is not None:
+        params["since"] = str(since)
+    if page_size:
+        params["page"] = page
+        params["pageSize"] = page_size
+    response = backend.get(
+        "/get-transaction-history",
+        headers={"Authorization": f"Bearer {token}"},
+        params=params,
+        stream=True
+    )
+    with response:
+        response.raise_for_status()
+        return _parse_streamed(_stream_table_text(_body_text(response)), on_progress)
+
+
+def _fetch_since(token, accnumber, since, on_progress=None):
+    if not SERVER_PAGE_SIZE:
+        return fetch_history(token, accnumber, since=since, on_progress=on_progress)
+    frames = []
+    malformed = []
+    page = 0
+    while True:
+        batch, batch_malformed = fetch_history(
+            token, accnumber, since=since, page=page, page_size=SERVER_PAGE_SIZE, on_progress=on_progress)
+        frames.append(batch)
+        malformed.extend(batch_malformed)
+        if len(batch) + len(batch_malformed) < SERVER_PAGE_SIZE:
+            return pd.concat(frames, ignore_index=True), malformed
+        page += 1
+
+
+# Store account columns as categoricals: a history repeats the owner's account on
+# every row and a handful of counterparties, so the codes are far smaller than int64
+def compact_frame(frame):
+    return frame.astype({
+        "fromAccount": "category",
+        "toAccount": "category",
+        "status": "category",
+    })
+
+
+def _merge(held, fetched, since):
+    # The backend may ignore `since`; keep only rows at or after the cached mark and
+    # drop the ones already held for that exact timestamp. Identical transfers in the
+    # same second are separate rows, so the held rows are counted, not just looked up:
+    # a fetched row is only dropped while the held count for it lasts.
+    fetched = fetched[fetched["date"] >= since]
+    if fetched.empty:
+        return held
+    edge = held[held["date"] == since]
+    if not edge.empty:
+        held_counts = Counter(edge.astype(str).itertuples(index=False, name=None))
+        is_new = []
+        for key in fetched.astype(str).itertuples(index=False, name=None):
+            if held_counts[key]:
+                held_counts[key] -= 1
+                is_new.append(False)
+            else:
+                is_new.append(True)
+        fetched = fetched[is_new]
+        if fetched.empty:
+            return held
+    # Mismatched categoricals concatenate to plain values; compact_frame re-encodes them
+    return pd.concat([fetched, held], ignore_index=True)
+
+
+# Return the cached history frame for an account (newest first), fetching only the
+# entries newer than the last cached timestamp once the cache is stale or a refresh is
+# asked for. The frame is only rebuilt when new rows arrive, so reruns reuse it as is.
+def load_history(cache, token, accnumber, refresh=False, on_progress=None):
+    entry = cache.get(accnumber)
+    now = time.monotonic()
+    if entry is not None and not refresh and now - entry["fetched_at"] < HISTORY_TTL:
+        return entry["frame"]
+
+    since = entry["last_ts"] if entry else None
+    fetched, malformed = _fetch_since(token, accnumber, since, on_progress)
+    if entry is None:
+        frame = compact_frame(fetched.sort_values("date", ascending=False, ignore_index=True))
+    else:
+        merged = _merge(entry["frame"], fetched, since) if since is not None else fetched
+        if merged is entry["frame"]:
+            frame = merged
+        else:
+            frame = compact_frame(merged.sort_values("date", ascending=False, ignore_index=True))
+
+    cache[accnumber] = {
+        "frame": frame,
+        "last_ts": frame["date"].iloc[0] if not frame.empty else since,
+        "fetched_at": now,
+        "malformed": malformed,
+    }
+    return frame
+
+
+def page_count(total_rows, page_size=PAGE_SIZE):
+    return max(1, -(-total_rows // page_size))
+
+
+# One page of the view with display column names; only this slice is copied. With
+# `positions` (e.g. from history_query.query) the page is taken from those rows.
+def page_frame(frame, page, page_size=PAGE_SIZE, positions=None):
+    start = page * page_size
+    if positions is None:
+        return frame.iloc[start:start + page_size].rename(columns=DISPLAY_COLUMNS)
+    return frame.iloc[positions[start:start + page_size]].rename(columns=DISPLAY_COLUMNS)
@@ -0,0 +1,166 @@
+import csv
+import io
+from collections import namedtuple
+from operator import methodcaller
+
+import numpy as np
+import pandas as pd
+
+# Backend table header -> column name used by the app
+COLUMN_MAP = {
+    "Date and Time": "date",
+    "Sender": "fromAccount",
+    "Receiver": "toAccount",
+    "Amount": "amount",
+    "Status": "status",
+}
+COLUMNS = list(COLUMN_MAP.values())
+
+ParsedHistory = namedtuple("ParsedHistory", ["frame", "malformed"])
+# One rejected input row: 1-based line number in the payload, the raw line and why
+MalformedRow = namedtuple("MalformedRow", ["line_number", "line", "reason"])
+
+
+def empty_frame():
+    return pd.DataFrame({
+        "date": pd.Series(dtype="datetime64[ns]"),
+        "fromAccount": pd.Series(dtype="int64"),
+        "toAccount": pd.Series(dtype="int64"),
+        "amount": pd.Series(dtype="float64"),
+        "status": pd.Series(dtype="category"),
+    })
+
+
+def is_separator(line):
+    stripped = line.replace("|", "").replace("-", "").replace(":", "").strip()
+    return not stripped and "-" in line
+
+
+def _to_datetime(values):
+    parsed = pd.to_datetime(values, format="ISO8601", errors="coerce")
+    if parsed.isna().all() and len(values):
+        # Not ISO formatted; let pandas infer the format once for the whole column
+        parsed = pd.to_datetime(values, errors="coerce")
+    return parsed
+
+
+def _to_numeric(values):
+    if pd.api.types.is_numeric_dtype(values):
+        return values
+    return pd.to_numeric(values, errors="coerce")
+
+
+# Strip padding from the (few) distinct status values rather than from every row
+def _strip_categories(values):
+    values = values.cat.remove_unused_categories()
+    stripped = values.cat.categories.str.strip()
+    if stripped.has_duplicates:
+        return values.astype(str).str.strip().astype("category")
+    return values.cat.rename_categories(stripped)
+
+
+# Convert raw string/number columns to the typed layout, splitting off rows that fail
+def _typed_frame(raw, line_numbers, lines):
+    date = _to_datetime(raw["date"])
+    from_account = _to_numeric(raw["fromAccount"])
+    to_account = _to_numeric(raw["toAccount"])
+    amount = _to_numeric(raw["amount"])
+
+    checks = (
+        (date.isna(), "invalid date"),
+        (from_account.isna() | (from_account % 1 != 0), "invalid sender account"),
+        (to_account.isna() | (to_account % 1 != 0), "invalid receiver account"),
+        (amount.isna(), "invalid amount"),
+    )
+    bad = np.zeros(len(raw), dtype=bool)
+    reasons = {}
+    for mask, reason in checks:
+        mask = mask.to_numpy() & ~bad
+        for idx in np.flatnonzero(mask):
+            reasons[idx] = reason
+        bad |= mask
+    malformed = [MalformedRow(int(line_numbers[idx]), lines[idx], reasons[idx]) for idx in sorted(reasons)]
+
+    good = ~bad
+    status = raw["status"][good]
+    if not isinstance(status.dtype, pd.CategoricalDtype):
+        status = status.astype(str).astype("category")
+    frame = pd.DataFrame({
+        "date": date[good].astype("datetime64[ns]"),
+        "fromAccount": from_account[good].astype("int64"),
+        "toAccount": to_account[good].astype("int64"),
+        "amount": amount[good].astype("float64"),
+        "status": _strip_categories(status),
+    }).reset_index(drop=True)
+    return frame, malformed
+
+
+# Parse the pipe-delimited history table in one pass into typed columns
+# (datetime date, int64 account ids, float amount, categorical status).
+# Rows that do not fit the header or fail type conversion are returned in
+# `malformed` instead of being silently dropped.
+def parse_history_table(text):
+    lines = text.strip().split("\n")
+    if len(lines) < 2:  # At least header and one row
+        return ParsedHistory(empty_frame(), [])
+
+    headers = [h.strip() for h in lines[0].split("|")]
+    missing = [name for name in COLUMN_MAP if name not in headers]
+    if missing:
+        raise ValueError(f"History table is missing columns: {', '.join(missing)}")
+
+    first_row = 2 if is_separator(lines[1]) else 1
+    body = lines[first_row:]
+    line_numbers = np.arange(first_row + 1, first_row + 1 + len(body))
+
+    malformed = []
+    field_counts = np.fromiter(map(methodcaller("count", "|"), body), dtype=np.int64, count=len(body))
+    bad_width = field_counts != len(headers) - 1
+    keep = ~bad_width
+    for idx in np.flatnonzero(bad_width):
+        if body[idx].strip():
+            malformed.append(MalformedRow(int(line_numbers[idx]), body[idx],
+                                          f"expected {len(headers)} fields, got {field_counts[idx] + 1}"))
+
+    if not keep.any():
+        return ParsedHistory(empty_frame(), malformed)
+    if keep.all():
+        kept_lines = body
+    else:
+        kept_lines = [line for line, ok in zip(body, keep) if ok]
+    kept_numbers = line_numbers[keep]
+
+    names = [name or f"_unnamed_{i}" for i, name in enumerate(headers)]
+    raw = pd.read_csv(
+        io.StringIO("\n".join(kept_lines)),
+        sep="|",
+        header=None,
+        names=names,
+        usecols=list(COLUMN_MAP),
+        # Numeric columns are converted by the C parser; a column holding a bad value
+        # comes back as strings and is coerced below so the bad rows can be reported
+        dtype={"Date and Time": object, "Status": "category"},
+        keep_default_na=False,
+        quoting=csv.QUOTE_NONE,
+        skipinitialspace=True,
+        engine="c",
+    ).rename(columns=COLUMN_MAP)
+
+    frame, rejected = _typed_frame(raw, kept_numbers, kept_lines)
+    malformed.extend(rejected)
+    malformed.sort(key=lambda row: row.line_number)
+    return ParsedHistory(frame, malformed)
+
+
+# Build the same typed frame from a JSON list of history entries
+def parse_history_records(records):
+    if not records:
+        return ParsedHistory(empty_frame(), [])
+    raw = pd.DataFrame.from_records(records)
+    missing = [name for name in COLUMNS if name not in raw.columns]
+    if missing:
+        raise ValueError(f"History entries are missing fields: {', '.join(missing)}")
+    raw = raw[COLUMNS].astype({"date": object})
+    line_numbers = np.arange(1, len(raw) + 1)
+    frame, malformed = _typed_frame(raw, line_numbers, [repr(record) for record in records])
+    return ParsedHistory(frame, malformed)
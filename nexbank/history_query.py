@@ -0,0 +1,140 @@
+import numpy as np
+import pandas as pd
+
+# Filtering and monthly aggregates over a cached history frame. The frame is indexed
+# once (dates, counterparties, months as plain numpy arrays) and every filter change
+# after that is a handful of vectorized lookups, without refetching or rebuilding it.
+
+# Statuses of transfers that moved no money, compared case-insensitively
+FAILED_STATUSES = ("FAILED",)
+
+
+class HistoryIndex:
+    """Lookup structures for one history frame, which is sorted newest first.
+
+    - dates: ascending datetime64 view of the date column, for binary search
+    - counterparties: account -> the rows with that counterparty
+    - month code and direction (incoming or not) per row, for monthly inflow/outflow sums
+    - failed: rows whose status is one of FAILED_STATUSES, left out of money totals
+    """
+
+    __slots__ = ("frame", "owner", "dates", "amounts", "status_codes", "statuses",
+                 "counterparty", "by_counterparty", "counterparties", "months", "incoming", "failed")
+
+    def __init__(self, frame, owner):
+        self.frame = frame
+        self.owner = owner
+        # Newest first, so the ascending order is the reversed column
+        self.dates = frame["date"].to_numpy(dtype="datetime64[ns]")[::-1]
+        self.amounts = frame["amount"].to_numpy(dtype="float64")
+        status = frame["status"].astype("category")
+        self.status_codes = status.cat.codes.to_numpy()
+        self.statuses = list(status.cat.categories)
+        failed_codes = [code for code, name in enumerate(self.statuses)
+                        if str(name).strip().upper() in FAILED_STATUSES]
+        self.failed = np.isin(self.status_codes, failed_codes)
+
+        from_account = np.asarray(frame["fromAccount"], dtype="int64")
+        to_account = np.asarray(frame["toAccount"], dtype="int64")
+        self.incoming = from_account != owner
+        self.counterparty = np.where(self.incoming, from_account, to_account)
+        # Hash index: account -> (start, stop) into by_counterparty, which holds row
+        # positions grouped by counterparty and ascending within each group
+        self.by_counterparty = np.argsort(self.counterparty, kind="stable").astype("int32")
+        accounts, starts = np.unique(self.counterparty[self.by_counterparty], return_index=True)
+        stops = np.append(starts[1:], len(self.counterparty))
+        self.counterparties = dict(zip(accounts.tolist(), zip(starts.tolist(), stops.tolist())))
+        dates = frame["date"]
+        self.months = (dates.dt.year * 12 + dates.dt.month - 1).to_numpy(dtype="int64")
+
+    @property
+    def nbytes(self):
+        return int(self.dates.nbytes + self.amounts.nbytes + self.status_codes.nbytes
+                   + self.counterparty.nbytes + self.by_counterparty.nbytes + self.months.nbytes
+                   + self.incoming.nbytes + self.failed.nbytes)
+
+    # Positions (ascending) of the rows with this counterparty account
+    def rows_with(self, account):
+        bounds = self.counterparties.get(int(account))
+        if bounds is None:
+            return None
+        return self.by_counterparty[bounds[0]:bounds[1]]
+
+    # Positions (newest first) of the rows dated within [start, end); either may be None
+    def date_range(self, start=None, end=None):
+        n = len(self.dates)
+        lo = 0 if start is None else np.searchsorted(self.dates, np.datetime64(start, "ns"), "left")
+        hi = n if end is None else np.searchsorted(self.dates, np.datetime64(end, "ns"), "left")
+        return n - hi, n - lo
+
+
+# Index for a history cache entry, built on first use and kept on the entry until the
+# cached frame is replaced
+def get_index(entry, owner):
+    index = entry.get("index")
+    if index is None or index.frame is not entry["frame"] or index.owner != int(owner):
+        index = entry["index"] = HistoryIndex(entry["frame"], int(owner))
+    return index
+
+
+# Positions (newest first) of the rows matching every given filter:
+# - start/end: dates, end exclusive
+# - counterparties: account numbers sent to or received from
+# - min_amount/max_amount: inclusive bounds
+# - statuses: status values to keep
+def query(index, start=None, end=None, counterparties=None, min_amount=None, max_amount=None,
+          statuses=None):
+    first, last = index.date_range(start, end)
+    if counterparties:
+        found = [index.rows_with(account) for account in counterparties]
+        found = [positions for positions in found if positions is not None]
+        if not found:
+            return np.empty(0, dtype="int64")
+        positions = np.sort(np.concatenate(found)) if len(found) > 1 else found[0]
+        positions = positions[np.searchsorted(positions, first):np.searchsorted(positions, last)]
+        positions = positions.astype("int64")
+    else:
+        positions = np.arange(first, last)
+
+    mask = None
+    if min_amount is not None or max_amount is not None:
+        amounts = index.amounts[positions]
+        mask = np.ones(len(positions), dtype=bool)
+        if min_amount is not None:
+            mask &= amounts >= min_amount
+        if max_amount is not None:
+            mask &= amounts <= max_amount
+    if statuses is not None and len(statuses) < len(index.statuses):
+        codes = [index.statuses.index(status) for status in statuses if status in index.statuses]
+        keep = np.isin(index.status_codes[positions], codes)
+        mask = keep if mask is None else mask & keep
+    return positions if mask is None else positions[mask]
+
+
+# The given positions without failed transfers, which moved no money
+def settled(index, positions):
+    return positions[~index.failed[positions]]
+
+
+# Inflow, outflow and net per calendar month over the given rows, newest month first;
+# failed transfers are left out of the sums
+def monthly_totals(index, positions):
+    positions = settled(index, positions)
+    months = index.months[positions]
+    amounts = index.amounts[positions]
+    incoming = index.incoming[positions]
+    if not len(months):
+        return pd.DataFrame({"Month": [], "Inflow": [], "Outflow": [], "Net": []})
+    first = months.min()
+    slots = months - first
+    size = int(slots.max()) + 1
+    inflow = np.bincount(slots, weights=np.where(incoming, amounts, 0.0), minlength=size)
+    outflow = np.bincount(slots, weights=np.where(incoming, 0.0, amounts), minlength=size)
+    present = np.flatnonzero(np.bincount(slots, minlength=size))[::-1]
+    codes = present + first
+    return pd.DataFrame({
+        "Month": [f"{code // 12}-{code % 12 + 1:02d}" for code in codes],
+        "Inflow": inflow[present],
+        "Outflow": outflow[present],
+        "Net": inflow[present] - outflow[present],
+    })
@@ -0,0 +1,120 @@
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import requests.exceptions
+
+from nexbank import backend
+
+# Worker threads shared by every Streamlit session in the process
+STATEMENT_WORKERS = int(os.environ.get("NEXBANK_STATEMENT_WORKERS", "4"))
+# Seconds a finished job stays queryable before it is pruned
+JOB_RETENTION = 600
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+FINISHED = (DONE, FAILED)
+
+_executor = None
+_jobs = {}
+_active_by_key = {}
+_lock = threading.Lock()
+
+
+class Job:
+    __slots__ = ("id", "key", "status", "message", "created_at", "finished_at")
+
+    def __init__(self, key):
+        self.id = uuid.uuid4().hex
+        self.key = key
+        self.status = QUEUED
+        self.message = ""
+        self.created_at = time.time()
+        self.finished_at = None
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        with _lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=STATEMENT_WORKERS,
+                                               thread_name_prefix="statement-job")
+    return _executor
+
+
+def _prune(now):
+    for job_id in [job_id for job_id, job in _jobs.items()
+                   if job.status in FINISHED and now - job.finished_at > JOB_RETENTION]:
+        del _jobs[job_id]
+
+
+# Ask the backend to build and email a statement; returns (ok, message) in the same
+# wording the dashboard has always shown
+def send_statement(token, accnumber, month, year):
+    headers = {
+        "Authorization": f"Bearer {token}",
+        "Content-Type": "application/x-www-form-urlencoded"
+    }
+    try:
+        response = backend.post(
+            "/send-statement",
+            headers=headers,
+            data={"accountNumber": accnumber, "month": month, "year": year}
+        )
+        response.raise_for_status()
+        response_data = response.json()
+        if response.status_code == 200:
+            return True, "Statement sent"
+        return False, f"Failed to send statement: {response_data.get('message', 'Unknown error')}"
+    except requests.exceptions.HTTPError as e:
+        if e.response.status_code == 400:
+            try:
+                response_data = e.response.json()
+                return False, f"Failed to send statement: {response_data.get('message', 'Invalid request')}"
+            except ValueError:
+                return False, "Failed to send statement: Invalid response from server."
+        return False, f"Failed to send statement: {str(e)}"
+    except requests.exceptions.RequestException as e:
+        return False, f"Failed to send statement: {str(e)}"
+    except ValueError as e:
+        return False, f"Failed to send statement: Invalid JSON response: {str(e)}"
+
+
+def _run(job, token, accnumber, month, year):
+    job.status = RUNNING
+    try:
+        ok, message = send_statement(token, accnumber, month, year)
+    except Exception as e:  # keep the worker alive and report the failure on the job
+        ok, message = False, f"Failed to send statement: {str(e)}"
+    with _lock:
+        job.message = message
+        job.status = DONE if ok else FAILED
+        job.finished_at = time.time()
+        if _active_by_key.get(job.key) == job.id:
+            del _active_by_key[job.key]
+
+
+# Queue a statement request and return its job id. A request for an account/month/year
+# that is already queued or running returns the existing job instead of a new one.
+def submit_statement(token, accnumber, month, year):
+    key = (str(accnumber), int(month), int(year))
+    with _lock:
+        now = time.time()
+        _prune(now)
+        active_id = _active_by_key.get(key)
+        if active_id is not None:
+            return active_id
+        job = Job(key)
+        _jobs[job.id] = job
+        _active_by_key[key] = job.id
+    _get_executor().submit(_run, job, token, accnumber, int(month), int(year))
+    return job.id
+
+
+def get_job(job_id):
+    return _jobs.get(job_id)
@@ -0,0 +1,216 @@
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from nexbank import circuit_breaker, session_model
+
+# Process-wide latency and error metrics for backend calls and page renders, exported
+# in the Prometheus text format. Backend time and Streamlit render time are recorded
+# separately so a slow page can be attributed to one or the other.
+
+logger = logging.getLogger(__name__)
+
+# Histogram bucket upper bounds in seconds
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# Serve /metrics on this port when set (e.g. for a Prometheus scrape job)
+METRICS_PORT = int(os.environ.get("NEXBANK_METRICS_PORT", "0"))
+# Address the /metrics server listens on; local only unless set (e.g. "0.0.0.0" behind
+# a firewall that admits only the scraper), as the metrics reveal usage and latencies
+METRICS_HOST = os.environ.get("NEXBANK_METRICS_HOST", "127.0.0.1")
+# Rewrite this file with the current metrics every METRICS_FLUSH_INTERVAL seconds when set
+METRICS_FILE = os.environ.get("NEXBANK_METRICS_FILE", "")
+METRICS_FLUSH_INTERVAL = float(os.environ.get("NEXBANK_METRICS_FLUSH_INTERVAL", "15"))
+
+
+class Histogram:
+    """Cumulative-bucket histogram for one label set."""
+
+    __slots__ = ("counts", "total", "count")
+
+    def __init__(self):
+        self.counts = [0] * len(BUCKETS)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, seconds):
+        for i, bound in enumerate(BUCKETS):
+            if seconds <= bound:
+                self.counts[i] += 1
+                break
+        self.total += seconds
+        self.count += 1
+
+
+_lock = threading.Lock()
+_request_seconds = {}  # (endpoint, method) -> Histogram
+_responses = {}  # (endpoint, status) -> count
+_errors = {}  # (endpoint, kind) -> count
+_render_seconds = {}  # page -> Histogram
+_exporters_started = False
+
+
+# One finished backend call; status is the HTTP status, or None if no response arrived
+def record_request(endpoint, method, seconds, status=None):
+    with _lock:
+        histogram = _request_seconds.get((endpoint, method))
+        if histogram is None:
+            histogram = _request_seconds[(endpoint, method)] = Histogram()
+        histogram.observe(seconds)
+        if status is not None:
+            _responses[(endpoint, status)] = _responses.get((endpoint, status), 0) + 1
+
+
+# Failed backend call; kind is "timeout", "connection", "json_decode", "circuit_open"
+# (refused by the endpoint's circuit breaker) or "other"
+def record_error(endpoint, kind):
+    with _lock:
+        _errors[(endpoint, kind)] = _errors.get((endpoint, kind), 0) + 1
+
+
+def record_render(page, seconds):
+    with _lock:
+        histogram = _render_seconds.get(page)
+        if histogram is None:
+            histogram = _render_seconds[page] = Histogram()
+        histogram.observe(seconds)
+
+
+# Time the body as one render of `page`; st.rerun() and st.stop() raise through here,
+# so the time is recorded in a finally block
+@contextmanager
+def timed_render(page):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_render(page, time.perf_counter() - start)
+
+
+def _labels(**labels):
+    return ",".join(f'{name}="{value}"' for name, value in labels.items())
+
+
+def _histogram_lines(name, histograms, label_names):
+    lines = []
+    for key, histogram in sorted(histograms.items()):
+        values = key if isinstance(key, tuple) else (key,)
+        labels = _labels(**dict(zip(label_names, values)))
+        cumulative = 0
+        for bound, count in zip(BUCKETS, histogram.counts):
+            cumulative += count
+            lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+        lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+        lines.append(f"{name}_sum{{{labels}}} {histogram.total:.6f}")
+        lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+    return lines
+
+
+# Every metric in the Prometheus text exposition format
+def render_text():
+    with _lock:
+        lines = [
+            "# HELP nexbank_backend_request_seconds Backend call latency, including retries.",
+            "# TYPE nexbank_backend_request_seconds histogram",
+        ]
+        lines += _histogram_lines("nexbank_backend_request_seconds", _request_seconds, ("endpoint", "method"))
+        lines += [
+            "# HELP nexbank_backend_responses_total Backend responses by HTTP status.",
+            "# TYPE nexbank_backend_responses_total counter",
+        ]
+        for (endpoint, status), count in sorted(_responses.items()):
+            lines.append(f"nexbank_backend_responses_total{{{_labels(endpoint=endpoint, status=status)}}} {count}")
+        lines += [
+            "# HELP nexbank_backend_errors_total Backend calls that failed without a usable response.",
+            "# TYPE nexbank_backend_errors_total counter",
+        ]
+        for (endpoint, kind), count in sorted(_errors.items()):
+            lines.append(f"nexbank_backend_errors_total{{{_labels(endpoint=endpoint, kind=kind)}}} {count}")
+        lines += [
+            "# HELP nexbank_page_render_seconds Streamlit page render time, backend calls included.",
+            "# TYPE nexbank_page_render_seconds histogram",
+        ]
+        lines += _histogram_lines("nexbank_page_render_seconds", _render_seconds, ("page",))
+    lines += [
+        "# HELP nexbank_circuit_breaker_open Whether the endpoint's circuit breaker is failing calls fast (1) or not (0).",
+        "# TYPE nexbank_circuit_breaker_open gauge",
+    ]
+    for endpoint, state in sorted(circuit_breaker.states().items()):
+        lines.append(f"nexbank_circuit_breaker_open{{{_labels(endpoint=endpoint)}}} {int(state != circuit_breaker.CLOSED)}")
+    sessions = session_model.memory_report()
+    lines += [
+        "# HELP nexbank_sessions Streamlit sessions measured in the last hour.",
+        "# TYPE nexbank_sessions gauge",
+        f"nexbank_sessions {sessions['sessions']}",
+        "# HELP nexbank_session_state_bytes Session-state footprint across sessions, as last measured.",
+        "# TYPE nexbank_session_state_bytes gauge",
+        f'nexbank_session_state_bytes{{stat="total"}} {sessions["total_bytes"]}',
+        f'nexbank_session_state_bytes{{stat="max"}} {sessions["max_bytes"]}',
+        f'nexbank_session_state_bytes{{stat="mean"}} {sessions["mean_bytes"]:.0f}',
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def write_file(path):
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        f.write(render_text())
+    os.replace(tmp, path)
+
+
+def reset():
+    with _lock:
+        _request_seconds.clear()
+        _responses.clear()
+        _errors.clear()
+        _render_seconds.clear()
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = render_text().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _flush_forever(path, interval):
+    while True:
+        time.sleep(interval)
+        try:
+            write_file(path)
+        except OSError as e:
+            logger.warning("Metrics flush failed: %s", e)
+
+
+# Start the configured exporters once per process; later calls do nothing
+def start_exporters():
+    global _exporters_started
+    if _exporters_started:
+        return
+    with _lock:
+        if _exporters_started:
+            return
+        _exporters_started = True
+    if METRICS_PORT:
+        try:
+            server = ThreadingHTTPServer((METRICS_HOST, METRICS_PORT), _MetricsHandler)
+        except OSError as e:
+            logger.warning("Metrics server failed: %s", e)
+        else:
+            server.daemon_threads = True
+            threading.Thread(target=server.serve_forever, name="nexbank-metrics", daemon=True).start()
+    if METRICS_FILE:
+        threading.Thread(target=_flush_forever, args=(METRICS_FILE, METRICS_FLUSH_INTERVAL),
+                         name="nexbank-metrics-flush", daemon=True).start()
@@ -0,0 +1,76 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Dashboard data fetched in parallel right after login, so the sections open on data
+# that is already cached instead of fetching one at a time on first click.
+
+# Worker threads shared by every Streamlit session in the process
+PREFETCH_WORKERS = int(os.environ.get("NEXBANK_PREFETCH_WORKERS", "8"))
+# Seconds a section waits for its prefetch to land before fetching on its own
+PREFETCH_WAIT = 30.0
+
+_executor = None
+_lock = threading.Lock()
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        with _lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=PREFETCH_WORKERS,
+                                               thread_name_prefix="dashboard-prefetch")
+    return _executor
+
+
+# Tasks run off the script thread and cannot touch st.session_state, so they get a
+# plain dict of what they need; caches in it are the session's own dicts and are
+# filled in place
+def _history(session):
+    from nexbank import history
+    history.load_history(session["history_cache"], session["token"], session["accnumber"])
+
+
+# The login response already carried a balance; this catches anything that has
+# moved since and primes the ETag for the live refresh
+def _balance(session):
+    from nexbank import balance
+    balance.refresh(session["balance_cache"], session["token"], session["accnumber"])
+
+
+DASHBOARD_TASKS = {
+    "history": _history,
+    "balance": _balance,
+}
+
+
+# Start every dashboard task at once; returns {task name: Future} for the session to keep
+def start_dashboard(session):
+    executor = _get_executor()
+    return {name: executor.submit(task, session) for name, task in DASHBOARD_TASKS.items()}
+
+
+# True once the named task has finished without raising
+def ready(futures, name):
+    future = (futures or {}).get(name)
+    return future is not None and future.done() and future.exception() is None
+
+
+# Wait for the named task if it is still running so the caller does not fetch the same
+# data twice; False if it was never started, failed or timed out
+def wait(futures, name, timeout=PREFETCH_WAIT):
+    future = (futures or {}).get(name)
+    if future is None:
+        return False
+    try:
+        future.result(timeout=timeout)
+    except Exception:  # the caller falls back to fetching the data itself
+        return False
+    return True
+
+
+# Drop tasks that have not started yet, e.g. on logout
+def cancel(futures):
+    for future in (futures or {}).values():
+        future.cancel()
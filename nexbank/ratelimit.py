@@ -0,0 +1,125 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+
+# Rate limiting for OTP requests and security answer attempts
+MAX_ATTEMPTS = 5
+ATTEMPT_WINDOW = 3600  # 1 hour in seconds
+# Most (user_id, attempt_type) keys the local backend tracks; once every one of them
+# still has attempts inside the window, attempts under new keys are refused
+MAX_KEYS = int(os.environ.get("NEXBANK_RATE_LIMIT_MAX_KEYS", "100000"))
+
+
+class _Window:
+    """Ring buffer holding the last `limit` attempt times for one key."""
+
+    __slots__ = ("times", "head", "last")
+
+    def __init__(self, limit):
+        self.times = [None] * limit
+        self.head = 0  # slot of the oldest attempt, overwritten by the next one
+        self.last = 0.0
+
+    # Record an attempt if fewer than `limit` fall inside the window; O(1)
+    def hit(self, now, window):
+        oldest = self.times[self.head]
+        if oldest is not None and now - oldest < window:
+            return False
+        self.times[self.head] = now
+        self.head = (self.head + 1) % len(self.times)
+        self.last = now
+        return True
+
+
+class LocalBackend:
+    """In-process store shared by every Streamlit session of this server.
+
+    Keys are kept in the order of their last recorded attempt; a key whose last
+    attempt has left the window carries no state worth keeping and is evicted. A key
+    still inside its window is never dropped, since that would reset its limit: once
+    MAX_KEYS live keys are tracked, attempts under new keys are refused until some
+    expire, so memory stays bounded and the limit fails closed.
+    """
+
+    def __init__(self, max_keys=MAX_KEYS):
+        self.max_keys = max_keys
+        self._windows = OrderedDict()
+        self._lock = threading.Lock()
+
+    def hit(self, key, limit, window, now):
+        with self._lock:
+            self._evict(now, window)
+            entry = self._windows.get(key)
+            if entry is None:
+                if len(self._windows) >= self.max_keys:
+                    return False
+                entry = self._windows[key] = _Window(limit)
+            allowed = entry.hit(now, window)
+            if allowed:
+                self._windows.move_to_end(key)
+            return allowed
+
+    # Drop keys whose last attempt has left the window, oldest first
+    def _evict(self, now, window):
+        windows = self._windows
+        while windows:
+            key, entry = next(iter(windows.items()))
+            if now - entry.last < window:
+                break
+            del windows[key]
+
+    def __len__(self):
+        return len(self._windows)
+
+
+class StoreBackend:
+    """Backend over a Redis-like key/value store.
+
+    `store` needs `get(key)` and `set(key, value, ex=seconds)` (the redis-py
+    signatures). Each key holds its ring buffer as text and expires with the window,
+    so idle keys are dropped by the store itself. Updates are serialised by a local
+    lock; stores shared between processes should use an atomic script instead.
+    """
+
+    def __init__(self, store, prefix="nexbank:ratelimit:"):
+        self.store = store
+        self.prefix = prefix
+        self._lock = threading.Lock()
+
+    def hit(self, key, limit, window, now):
+        store_key = self.prefix + ":".join(str(part) for part in key)
+        with self._lock:
+            raw = self.store.get(store_key)
+            if isinstance(raw, bytes):
+                raw = raw.decode()
+            entry = _Window(limit)
+            if raw:
+                head, *times = raw.split(",")
+                if len(times) == limit:
+                    entry.head = int(head)
+                    entry.times = [float(t) if t else None for t in times]
+            allowed = entry.hit(now, window)
+            if allowed:
+                value = ",".join([str(entry.head)] + ["" if t is None else repr(t) for t in entry.times])
+                self.store.set(store_key, value, ex=int(window) + 1)
+            return allowed
+
+
+_backend = LocalBackend()
+
+
+# Swap the process-wide backend, e.g. for a StoreBackend over a shared store
+def set_backend(backend):
+    global _backend
+    _backend = backend
+
+
+def get_backend():
+    return _backend
+
+
+# Allow at most MAX_ATTEMPTS per ATTEMPT_WINDOW for each (user_id, attempt_type); the
+# limit is shared by every session in the process, so a new browser tab does not reset it
+def check_rate_limit(user_id, attempt_type):
+    return _backend.hit((str(user_id), attempt_type), MAX_ATTEMPTS, ATTEMPT_WINDOW, time.time())
@@ -0,0 +1,52 @@
+import os
+
+import streamlit as st
+
+from nexbank import backend
+
+# Reference data shared by every Streamlit session of this process: static lookups are
+# built once at import, and per-account reads from the backend are cached with a TTL
+# (st.cache_data, which hands each caller its own copy) and explicit invalidation.
+
+# Seconds a cached backend lookup is reused
+REFERENCE_TTL = float(os.environ.get("NEXBANK_REFERENCE_TTL", "300"))
+# Most cached lookups per function before the least recently used are dropped
+REFERENCE_MAX_ENTRIES = int(os.environ.get("NEXBANK_REFERENCE_MAX_ENTRIES", "10000"))
+
+# Security questions offered at registration, in display order; the backend identifies
+# each by its 1-based position
+SECURITY_QUESTIONS = (
+    "What is your pet's name?",
+    "What is your mother's maiden name?",
+    "What is the name of your first school?",
+)
+QUESTION_CHOICES = {question: number for number, question in enumerate(SECURITY_QUESTIONS, start=1)}
+
+
+class SecurityQuestionError(Exception):
+    """The backend answered without a security question; carries its message."""
+
+
+# Security question for an account, from /get-security-question. Only answers carrying a
+# question are cached; HTTP and network errors and SecurityQuestionError propagate and
+# the next call asks the backend again.
+@st.cache_data(ttl=REFERENCE_TTL, max_entries=REFERENCE_MAX_ENTRIES, show_spinner=False)
+def security_question(accnumber, phone):
+    response = backend.get(
+        "/get-security-question",
+        params={"accountNumber": accnumber, "phoneNumber": phone}
+    )
+    response.raise_for_status()
+    response_data = response.json()
+    if not response_data.get("question"):
+        raise SecurityQuestionError(response_data.get("message", "Unknown error"))
+    return {"question": response_data["question"], "answerHash": response_data.get("answerHash")}
+
+
+# Drop a cached security question, or every one when no account is given (e.g. after a
+# registration, which may set an account's question)
+def invalidate_security_question(accnumber=None, phone=None):
+    if accnumber is None:
+        security_question.clear()
+    else:
+        security_question.clear(accnumber, phone)
@@ -0,0 +1,221 @@
+import logging
+import os
+import sys
+import threading
+import time
+import uuid
+
+# The session-state schema: every key the app keeps in st.session_state, its type, its
+# default and the page that owns it. Keys owned by a page or dashboard section are reset
+# to their defaults on the first run after the user leaves it, so form data (plaintext
+# passwords included), OTP flags and view state do not stay in memory for the rest of
+# the session. Keys owned by "app" live until logout. Each session's footprint, history
+# caches and their filter indexes included, is measured every SESSION_REPORT_INTERVAL
+# seconds and exported through nexbank.metrics; sessions that stop running (a closed
+# tab) drop out of the report after SESSION_REPORT_TTL.
+
+# Seconds between footprint measurements of one session
+SESSION_REPORT_INTERVAL = float(os.environ.get("NEXBANK_SESSION_REPORT_INTERVAL", "30"))
+# Seconds after which a session that stopped running is dropped from the report
+SESSION_REPORT_TTL = 3600
+
+APP = "app"
+
+logger = logging.getLogger(__name__)
+
+
+class Field:
+    """One session key: its type(s), how to build its default and the scope that owns it."""
+
+    __slots__ = ("name", "kind", "default", "owner")
+
+    def __init__(self, name, kind, default, owner):
+        self.name = name
+        self.kind = kind
+        self.default = default  # value, or a zero-argument callable for mutable defaults
+        self.owner = owner
+
+    def make(self):
+        return self.default() if callable(self.default) else self.default
+
+
+FIELDS = (
+    # Identity and navigation, kept until logout
+    Field("token", str, None, APP),
+    Field("accnumber", (str, int), None, APP),
+    Field("email", str, None, APP),
+    Field("balance", (int, float), None, APP),
+    Field("session_id", str, lambda: uuid.uuid4().hex, APP),
+    Field("current_page", str, "main", APP),
+    Field("dashboard_section", str, "welcome", APP),
+    Field("loading", bool, False, APP),
+    Field("flash_messages", list, list, APP),
+    # Caches and background work shared by several dashboard sections
+    Field("balance_cache", dict, dict, APP),
+    Field("history_cache", dict, dict, APP),
+    Field("dashboard_prefetch", dict, dict, APP),
+    Field("statement_jobs", list, list, APP),
+    # Pages
+    Field("backend_polling", bool, False, "main"),
+    Field("reg_stage", int, 1, "register"),
+    Field("reg_data", dict, dict, "register"),
+    Field("reg_pwd1", str, "", "register"),
+    Field("login_data", dict, dict, "login"),
+    Field("show_otp_input", bool, False, "login"),
+    Field("forgot_pwd_stage", int, 1, "forgot_pwd"),
+    Field("forgot_data", dict, dict, "forgot_pwd"),
+    Field("forgot_pwd1", str, "", "forgot_pwd"),
+    # Dashboard sections
+    Field("transfer_otp_requested", bool, False, "dashboard/transfer"),
+    Field("transfer_otp_request_id", str, None, "dashboard/transfer"),
+    Field("transaction_history", object, None, "dashboard/history"),
+    Field("history_page", int, 0, "dashboard/history"),
+    Field("history_filters", tuple, None, "dashboard/history"),
+    Field("statement_polling", bool, False, "dashboard/statement"),
+    Field("bulk_batch", str, None, "dashboard/bulk_transfer"),
+    Field("bulk_otp_requested", bool, False, "dashboard/bulk_transfer"),
+    Field("bulk_polling", bool, False, "dashboard/bulk_transfer"),
+)
+FIELDS_BY_NAME = {field.name: field for field in FIELDS}
+
+
+def _drop_history_indexes(cache):
+    for entry in cache.values():
+        entry.pop("index", None)
+
+
+# Parts of "app" keys that only some sections use, trimmed while none of them is open:
+# (key, scopes that need it, trim function). History filter indexes are rebuilt on demand.
+TRIMS = (
+    ("history_cache", ("dashboard/history", "dashboard/statement"), _drop_history_indexes),
+)
+
+
+# Seed every missing key with its default
+def init(state):
+    for field in FIELDS:
+        if field.name not in state:
+            state[field.name] = field.make()
+
+
+# Scopes in use for the page being shown
+def active_scopes(page, section):
+    scopes = {APP, page}
+    if page == "dashboard":
+        scopes.add(f"dashboard/{section}")
+    return scopes
+
+
+# Reset the keys of every scope that is not active, and trim what inactive sections
+# alone were using
+def release(state, scopes):
+    for field in FIELDS:
+        if field.owner in scopes:
+            continue
+        value = state.get(field.name)
+        if callable(field.default):
+            stale = bool(value)  # a container holding something
+        elif field.default is None:
+            stale = value is not None
+        else:
+            stale = value != field.default
+        if stale:
+            state[field.name] = field.make()
+    for name, needed_by, trim in TRIMS:
+        if not scopes.intersection(needed_by) and state.get(name):
+            trim(state[name])
+
+
+# Keys whose value does not match the declared type (None is always allowed)
+def type_errors(state):
+    return [
+        field.name for field in FIELDS
+        if state.get(field.name) is not None and not isinstance(state.get(field.name), field.kind)
+    ]
+
+
+def _sizeof(value, seen):
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    memory_usage = getattr(value, "memory_usage", None)
+    if callable(memory_usage) and hasattr(value, "dtypes"):
+        # pandas DataFrame or Series
+        usage = memory_usage(index=True, deep=True)
+        return int(usage.sum() if hasattr(usage, "sum") else usage)
+    if hasattr(value, "nbytes") and hasattr(value, "dtype"):
+        # numpy array; getsizeof only includes the data when the array owns it
+        return sys.getsizeof(value) + (0 if value.base is None else int(value.nbytes))
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        return size + sum(_sizeof(key, seen) + _sizeof(item, seen) for key, item in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return size + sum(_sizeof(item, seen) for item in value)
+    if type(value).__module__.startswith("nexbank"):
+        # The app's own objects, slotted or not; library objects are counted shallowly
+        for cls in type(value).__mro__:
+            for slot in getattr(cls, "__slots__", ()):
+                if slot != "lock" and hasattr(value, slot):
+                    size += _sizeof(getattr(value, slot), seen)
+        if hasattr(value, "__dict__"):
+            size += _sizeof(value.__dict__, seen)
+    return size
+
+
+# Bytes held under each key of one session, largest first: [(key, owner, bytes)].
+# Objects shared between keys are counted once, under the first key reached.
+def footprint(state):
+    seen = set()
+    sizes = []
+    for key in list(state.keys()):
+        field = FIELDS_BY_NAME.get(key)
+        owner = field.owner if field is not None else "widget"
+        sizes.append((key, owner, _sizeof(state[key], seen)))
+    return sorted(sizes, key=lambda item: item[2], reverse=True)
+
+
+_session_bytes = {}  # session_id -> (bytes, measured_at)
+_lock = threading.Lock()
+
+
+def _prune(now):
+    for session_id in [session_id for session_id, (_, at) in _session_bytes.items()
+                       if now - at > SESSION_REPORT_TTL]:
+        del _session_bytes[session_id]
+
+
+# Measure this session's footprint for the report, at most every SESSION_REPORT_INTERVAL
+def record(state):
+    session_id = state.get("session_id")
+    if session_id is None:
+        return
+    now = time.monotonic()
+    previous = _session_bytes.get(session_id)
+    if previous is not None and now - previous[1] < SESSION_REPORT_INTERVAL:
+        return
+    total = sum(size for _, _, size in footprint(state))
+    mistyped = type_errors(state)
+    if mistyped:
+        logger.warning("session %s has unexpected value types for: %s", session_id, ", ".join(mistyped))
+    with _lock:
+        _session_bytes[session_id] = (total, now)
+        _prune(now)
+
+
+# Drop a session from the report, e.g. on logout
+def forget(session_id):
+    with _lock:
+        _session_bytes.pop(session_id, None)
+
+
+# Snapshot of the per-session footprint across this process
+def memory_report():
+    with _lock:
+        _prune(time.monotonic())
+        sizes = [size for size, _ in _session_bytes.values()]
+    return {
+        "sessions": len(sizes),
+        "total_bytes": sum(sizes),
+        "max_bytes": max(sizes, default=0),
+        "mean_bytes": sum(sizes) / len(sizes) if sizes else 0,
+    }
@@ -0,0 +1,211 @@
+import importlib.util
+import io
+import tempfile
+from datetime import date
+
+import pandas as pd
+
+from nexbank import history_query
+
+# Month statements built from the cached history instead of the backend's emailed
+# statement job. Each format is written chunk by chunk into a spooled temporary file
+# (kept in memory up to EXPORT_SPOOL_BYTES, on disk beyond), so the file is never
+# assembled as one string or bytes object.
+
+# Rows converted per chunk
+EXPORT_CHUNK_ROWS = 5000
+# Bytes kept in memory before the export spills to a temporary file
+EXPORT_SPOOL_BYTES = 1024 * 1024
+
+FORMATS = {
+    "CSV": ("csv", "text/csv"),
+    "Parquet": ("parquet", "application/octet-stream"),
+    "PDF": ("pdf", "application/pdf"),
+}
+
+COLUMNS = ["Date", "From Account", "To Account", "Direction", "Amount", "Status"]
+
+
+class Statement:
+    """One account month: the matching history rows, oldest first, and the totals of the
+    rows that moved money (failed transfers are listed but not counted)."""
+
+    __slots__ = ("accnumber", "month", "year", "rows", "inflow", "outflow")
+
+    def __init__(self, accnumber, month, year, rows, inflow, outflow):
+        self.accnumber = accnumber
+        self.month = month
+        self.year = year
+        self.rows = rows
+        self.inflow = inflow
+        self.outflow = outflow
+
+    @property
+    def period(self):
+        return f"{self.year}-{self.month:02d}"
+
+
+# Formats that can be written here; Parquet needs pyarrow
+def available_formats():
+    return [name for name in FORMATS if name != "Parquet" or importlib.util.find_spec("pyarrow")]
+
+
+def file_name(statement, fmt):
+    return f"nexbank-statement-{statement.accnumber}-{statement.period}.{FORMATS[fmt][0]}"
+
+
+# Select one month of a cached history entry through its filter index
+def month_statement(entry, accnumber, month, year):
+    index = history_query.get_index(entry, accnumber)
+    start = date(year, month, 1)
+    end = date(year + month // 12, month % 12 + 1, 1)
+    positions = history_query.query(index, start=start, end=end)[::-1]
+    frame = index.frame
+    incoming = index.incoming[positions]
+    amounts = index.amounts[positions]
+    rows = pd.DataFrame({
+        "Date": frame["date"].to_numpy()[positions],
+        "From Account": frame["fromAccount"].to_numpy(dtype="int64")[positions],
+        "To Account": frame["toAccount"].to_numpy(dtype="int64")[positions],
+        "Direction": pd.Categorical.from_codes((~incoming).astype("int8"), ["Credit", "Debit"]),
+        "Amount": amounts,
+        "Status": frame["status"].astype(str).to_numpy()[positions],
+    })
+    counted = ~index.failed[positions]
+    return Statement(str(accnumber), month, year, rows,
+                     float(amounts[incoming & counted].sum()), float(amounts[~incoming & counted].sum()))
+
+
+def _chunks(rows):
+    for start in range(0, len(rows), EXPORT_CHUNK_ROWS):
+        yield rows.iloc[start:start + EXPORT_CHUNK_ROWS]
+
+
+def _write_csv(statement, out):
+    text = io.TextIOWrapper(out, encoding="utf-8", newline="")
+    text.write(",".join(COLUMNS) + "\n")
+    for chunk in _chunks(statement.rows):
+        chunk.to_csv(text, header=False, index=False, date_format="%Y-%m-%d %H:%M:%S")
+    text.flush()
+    text.detach()
+
+
+def _write_parquet(statement, out):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema([
+        ("Date", pa.timestamp("ns")),
+        ("From Account", pa.int64()),
+        ("To Account", pa.int64()),
+        ("Direction", pa.string()),
+        ("Amount", pa.float64()),
+        ("Status", pa.string()),
+    ])
+    with pq.ParquetWriter(out, schema) as writer:
+        for chunk in _chunks(statement.rows):
+            writer.write_table(pa.Table.from_pandas(chunk.astype({"Direction": str}), schema=schema,
+                                                    preserve_index=False))
+        if statement.rows.empty:
+            writer.write_table(schema.empty_table())
+
+
+# PDF layout: A4 portrait in points, one monospaced table line per row
+PDF_PAGE = (595, 842)
+PDF_MARGIN = 40
+PDF_LEADING = 12
+PDF_FONT_SIZE = 8.5
+PDF_LINES_PER_PAGE = (PDF_PAGE[1] - 2 * PDF_MARGIN) // PDF_LEADING
+
+
+def _pdf_text(text):
+    text = text.encode("latin-1", "replace").decode("latin-1")
+    return "(" + text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)") + ")"
+
+
+def _pdf_lines(statement):
+    yield f"Nex Bank statement - account {statement.accnumber} - {statement.period}"
+    yield ""
+    yield (f"Transactions: {len(statement.rows):,}   Inflow: {statement.inflow:,.2f}   "
+           f"Outflow: {statement.outflow:,.2f}   Net: {statement.inflow - statement.outflow:,.2f}")
+    yield "Failed transfers are listed but not counted in the totals."
+    yield ""
+    yield f"{'Date':<19}  {'From':>12}  {'To':>12}  {'Type':<6}  {'Amount':>14}  Status"
+    yield "-" * 84
+    if statement.rows.empty:
+        yield "No transactions in this period."
+    for chunk in _chunks(statement.rows):
+        for when, sender, receiver, direction, amount, status in chunk.itertuples(index=False, name=None):
+            yield (f"{when:%Y-%m-%d %H:%M:%S}  {sender:>12}  {receiver:>12}  {direction:<6}  "
+                   f"{amount:>14,.2f}  {status}")
+
+
+# A minimal PDF 1.4 writer: uncompressed content streams in the Courier base font, with
+# objects written (and their offsets recorded for the xref table) as each page fills up
+def _write_pdf(statement, out):
+    offsets = {}
+    position = 0
+
+    def write(data):
+        nonlocal position
+        out.write(data)
+        position += len(data)
+
+    def write_object(number, body):
+        offsets[number] = position
+        write(f"{number} 0 obj\n".encode("latin-1") + body + b"\nendobj\n")
+
+    # 1 catalog, 2 page tree (written last, once the pages are known), 3 font
+    write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+    write_object(1, b"<< /Type /Catalog /Pages 2 0 R >>")
+    write_object(3, b"<< /Type /Font /Subtype /Type1 /BaseFont /Courier /Encoding /WinAnsiEncoding >>")
+    pages = []
+    next_number = 4
+
+    def write_page(lines, page_number):
+        nonlocal next_number
+        top = PDF_PAGE[1] - PDF_MARGIN
+        content = [f"BT /F1 {PDF_FONT_SIZE} Tf {PDF_LEADING} TL {PDF_MARGIN} {top} Td"]
+        content += [f"{_pdf_text(line)} '" for line in lines]
+        content.append(f"ET BT /F1 {PDF_FONT_SIZE} Tf {PDF_PAGE[0] - PDF_MARGIN - 40} {PDF_MARGIN / 2} Td "
+                       f"{_pdf_text(f'Page {page_number}')} Tj ET")
+        stream = "\n".join(content).encode("latin-1")
+        write_object(next_number, f"<< /Length {len(stream)} >>\nstream\n".encode("latin-1")
+                     + stream + b"\nendstream")
+        write_object(next_number + 1, (
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {PDF_PAGE[0]} {PDF_PAGE[1]}] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {next_number} 0 R >>"
+        ).encode("latin-1"))
+        pages.append(next_number + 1)
+        next_number += 2
+
+    lines = []
+    for line in _pdf_lines(statement):
+        lines.append(line)
+        if len(lines) == PDF_LINES_PER_PAGE:
+            write_page(lines, len(pages) + 1)
+            lines = []
+    if lines or not pages:
+        write_page(lines, len(pages) + 1)
+
+    kids = " ".join(f"{number} 0 R" for number in pages)
+    write_object(2, f"<< /Type /Pages /Kids [{kids}] /Count {len(pages)} >>".encode("latin-1"))
+    xref = position
+    entries = ["0000000000 65535 f "] + [f"{offsets[number]:010d} 00000 n " for number in range(1, next_number)]
+    write((f"xref\n0 {next_number}\n" + "\n".join(entries) + "\n"
+           f"trailer\n<< /Size {next_number} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n").encode("latin-1"))
+
+
+WRITERS = {
+    "CSV": _write_csv,
+    "Parquet": _write_parquet,
+    "PDF": _write_pdf,
+}
+
+
+# Write a statement in one of FORMATS; returns a binary file positioned at the start
+def export(statement, fmt):
+    out = tempfile.SpooledTemporaryFile(max_size=EXPORT_SPOOL_BYTES, mode="w+b")
+    WRITERS[fmt](statement, out)
+    out.seek(0)
+    return out
@@ -0,0 +1,64 @@
+import hashlib
+from pathlib import Path
+
+import streamlit as st
+
+# Enhanced Custom CSS with modern animations, read once per server process
+STYLESHEET = (Path(__file__).parent / "assets" / "theme.css").read_text(encoding="utf-8")
+THEME_VERSION = hashlib.sha1(STYLESHEET.encode("utf-8")).hexdigest()[:12]
+
+# Floating particles in the background
+PARTICLES_HTML = """
+<div class="particles" id="particles-js"></div>
+<script>
+    // Check if particles are already added
+    if (!document.getElementById('particles-js') || document.getElementById('particles-js').childElementCount > 0) {
+        return;
+    }
+
+    const particles = document.getElementById('particles-js');
+    const particleCount = 30;
+
+    for (let i = 0; i < particleCount; i++) {
+        const particle = document.createElement('div');
+        particle.classList.add('particle');
+
+        const size = Math.random() * 4 + 2;
+        particle.style.width = `${size}px`;
+        particle.style.height = `${size}px`;
+
+        particle.style.left = `${Math.random() * 100}%`;
+        particle.style.top = `${Math.random() * 100 + 100}%`;
+
+        const duration = Math.random() * 10 + 10;
+        particle.style.animationDuration = `${duration}s`;
+
+        particle.style.animationDelay = `${Math.random() * 5}s`;
+
+        particles.appendChild(particle);
+    }
+</script>
+"""
+
+# App header with enhanced animation
+HEADER_HTML = """
+<h1>
+    <span style="display: inline-block; animation: floatTitle 6s ease-in-out infinite;">🏦</span>
+    <span style="display: inline-block; animation: floatTitle 6s ease-in-out infinite 0.2s;">Nex</span>
+    <span style="display: inline-block; animation: floatTitle 6s ease-in-out infinite 0.4s;">Bank</span>
+</h1>
+"""
+
+# Stylesheet, particle layer and header as one element whose bytes only change with the
+# theme version. Streamlit caches new elements of 10 kB or more in the browser, so the
+# first run of a session ships it and every later rerun sends just its hash.
+CHROME_HTML = (
+    f'<style data-theme-version="{THEME_VERSION}">\n{STYLESHEET}</style>\n'
+    f"{PARTICLES_HTML}{HEADER_HTML}"
+)
+
+
+# Display the stylesheet, background particles and app header
+def render_chrome():
+    st.markdown(CHROME_HTML, unsafe_allow_html=True)
+    st.markdown("---")
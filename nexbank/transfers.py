@@ -0,0 +1,97 @@
+import hashlib
+import threading
+import time
+import uuid
+
+from nexbank import backend
+
+# Seconds a completed transfer is remembered so a repeated submission replays its result
+COMPLETED_TTL = 900
+# Response fields the backend may use to report the balance after a transfer
+BALANCE_FIELDS = ("balance", "newBalance", "updatedBalance", "remainingBalance")
+
+_inflight = set()
+_completed = {}  # key -> [completed_at, response_data, debit_applied]
+_lock = threading.Lock()
+
+
+class TransferInFlight(Exception):
+    pass
+
+
+# Identifier for one OTP round trip; a new one is issued every time an OTP is requested
+def new_otp_request_id():
+    return uuid.uuid4().hex
+
+
+# Idempotency key for one transfer: the same payee, amount and OTP request always map
+# to the same key, so double clicks and reruns are recognised as the same submission
+def idempotency_key(from_account, to_account, amount, otp_request_id):
+    raw = f"{from_account}|{to_account}|{float(amount):.2f}|{otp_request_id}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _prune(now):
+    for key in [key for key, (at, _, _) in _completed.items() if now - at > COMPLETED_TTL]:
+        del _completed[key]
+
+
+# POST /transfer once per idempotency key. Returns (response_data, replayed); replayed is
+# True when the key already completed and the stored response is returned instead of a
+# new request. Raises TransferInFlight while the same key is still being submitted.
+# Network and HTTP errors propagate as before and leave the key free for a retry, which
+# the backend can match through the Idempotency-Key header.
+def submit_transfer(token, payload, key):
+    with _lock:
+        now = time.monotonic()
+        _prune(now)
+        if key in _completed:
+            return _completed[key][1], True
+        if key in _inflight:
+            raise TransferInFlight()
+        _inflight.add(key)
+    try:
+        response = backend.post(
+            "/transfer",
+            json=payload,
+            headers={
+                "Authorization": f"Bearer {token}",
+                "Content-Type": "application/json",
+                "Idempotency-Key": key
+            }
+        )
+        response.raise_for_status()
+        response_data = response.json()
+        if response_data.get("status") == "success":
+            with _lock:
+                _completed[key] = [time.monotonic(), response_data, False]
+        return response_data, False
+    finally:
+        with _lock:
+            _inflight.discard(key)
+
+
+# True exactly once per completed transfer: the caller that gets it takes the amount off
+# the shown balance. A run stopped by a rerun after submit_transfer returned has not
+# applied it, so the replayed submission that follows still does.
+def claim_debit(key):
+    with _lock:
+        entry = _completed.get(key)
+        if entry is None:
+            return True
+        if entry[2]:
+            return False
+        entry[2] = True
+        return True
+
+
+# Balance reported by the server in a transfer response, or None if it sent none
+def balance_from_response(response_data):
+    for field in BALANCE_FIELDS:
+        value = response_data.get(field)
+        if value is not None:
+            try:
+                return float(value)
+            except (TypeError, ValueError):
+                return None
+    return None
@@ -0,0 +1,47 @@
+import html
+
+import streamlit as st
+
+PROGRESS_HTML = """
+<div class="progress-container">
+    <div class="progress-bar">{label}</div>
+</div>
+"""
+
+MESSAGE_CLASSES = {"success": "success-message", "error": "error-message"}
+
+
+# Show the animated progress bar while a backend request runs; the caller clears the
+# returned placeholder once the response is in, so no time is spent sleeping
+def show_progress(label):
+    st.session_state.loading = True
+    placeholder = st.empty()
+    update_progress(placeholder, label)
+    return placeholder
+
+
+# Replace the label of a progress bar from show_progress, e.g. with a running row count
+def update_progress(placeholder, label):
+    placeholder.markdown(PROGRESS_HTML.format(label=html.escape(label)), unsafe_allow_html=True)
+
+
+# Display an animated success or error message; the CSS fadeInOut animation hides it,
+# so the script thread never blocks waiting for it
+def animated_message(message, message_type="success"):
+    css_class = MESSAGE_CLASSES.get(message_type, "error-message")
+    st.markdown(f'<div class="{css_class}">{message}</div>', unsafe_allow_html=True)
+
+
+# Queue a message to be shown on the next run, for handlers that call st.rerun() right away
+def flash(message, message_type="success"):
+    st.session_state.setdefault("flash_messages", []).append((message, message_type))
+
+
+# Render and drop any queued flash messages
+def render_flashes():
+    messages = st.session_state.get("flash_messages")
+    if not messages:
+        return
+    st.session_state.flash_messages = []
+    for message, message_type in messages:
+        animated_message(message, message_type)
@@ -0,0 +1,177 @@
+import re
+from collections import namedtuple
+
+# Input validation, shared by the registration and password reset forms and by the
+# offline bulk-onboarding tools (validate_frame / validate_csv). Patterns are compiled
+# once, and a password is scanned once for all of its character classes.
+
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$')
+PHONE_PATTERN = re.compile(r'^\d{10}$')
+
+MIN_PASSWORD_LENGTH = 8
+SPECIAL_CHARACTERS = '@#$%^&+=!'
+
+# Password properties, one bit each
+LONG_ENOUGH = 1
+DIGIT = 2
+LOWER = 4
+UPPER = 8
+SPECIAL = 16
+ALL_CHARACTER_CLASSES = DIGIT | LOWER | UPPER | SPECIAL
+
+# Requirement table in display order: (property bit, message)
+PASSWORD_RULES = (
+    (LONG_ENOUGH, "At least 8 characters"),
+    (DIGIT, "At least one number"),
+    (LOWER, "At least one lowercase letter"),
+    (UPPER, "At least one uppercase letter"),
+    (SPECIAL, "At least one special character (@#$%^&+=!)"),
+)
+
+# Result of one password scan: bitmask of the properties present, and the messages of
+# the rules it fails (in PASSWORD_RULES order)
+PasswordCheck = namedtuple("PasswordCheck", ["properties", "unmet"])
+
+
+def _character_class(char):
+    bits = 0
+    if char.isdigit():
+        bits |= DIGIT
+    if char.islower():
+        bits |= LOWER
+    if char.isupper():
+        bits |= UPPER
+    if char in SPECIAL_CHARACTERS:
+        bits |= SPECIAL
+    return bits
+
+
+# Character class bits for every ASCII code point; other characters are classified with
+# the same str methods as they are met
+_ASCII_CLASSES = [_character_class(chr(code)) for code in range(128)]
+
+
+# Scan a password once and check it against every rule
+def check_password(password):
+    properties = LONG_ENOUGH if len(password) >= MIN_PASSWORD_LENGTH else 0
+    classes = 0
+    for char in password:
+        code = ord(char)
+        classes |= _ASCII_CLASSES[code] if code < 128 else _character_class(char)
+        if classes == ALL_CHARACTER_CLASSES:
+            break
+    properties |= classes
+    return PasswordCheck(properties, [message for bit, message in PASSWORD_RULES if not properties & bit])
+
+
+# Validate password strength; pass `check` to reuse a scan from check_password
+def validate_password_strength(password, check=None):
+    check = check or check_password(password)
+    return len(check.unmet) == 0, list(check.unmet)
+
+
+# Generate password strength meter HTML; pass `check` to reuse a scan from check_password
+def password_requirements(password, check=None):
+    check = check or check_password(password)
+    total_requirements = len(PASSWORD_RULES)
+    met_count = total_requirements - len(check.unmet)
+    progress_html = f"""
+    <div class="password-strength-container">
+        <div class="password-strength-header">
+            <span>Password Strength</span>
+            <span>{met_count}/{total_requirements}</span>
+        </div>
+        <div class="password-strength-meter">
+            <div class="password-strength-progress" style="width: {met_count / total_requirements * 100}%"></div>
+        </div>
+    </div>
+    """
+    return progress_html, list(check.unmet)
+
+
+# Input validation functions
+def validate_email(email):
+    return bool(EMAIL_PATTERN.fullmatch(email))
+
+
+def validate_phone(phone):
+    return bool(PHONE_PATTERN.fullmatch(phone))
+
+
+# ASCII-only equivalents of the password character classes, for vectorized matching
+_ASCII_CLASS_PATTERNS = {
+    DIGIT: "[0-9]",
+    LOWER: "[a-z]",
+    UPPER: "[A-Z]",
+    SPECIAL: f"[{re.escape(SPECIAL_CHARACTERS)}]",
+}
+
+
+def _column(frame, name):
+    values = frame[name].fillna("").astype(str)
+    return values, values.str.isascii().to_numpy(bool)
+
+
+# Vectorized pattern match; rows with non-ASCII text go through the scalar validator,
+# since string engines disagree on what \d matches beyond ASCII. Both sides use a full
+# match, as re's $ would also accept a trailing newline where RE2 does not.
+def _matches(values, ascii_rows, pattern, validate):
+    matched = values.str.fullmatch(pattern.pattern).to_numpy(bool, copy=True)
+    for i in (~ascii_rows).nonzero()[0]:
+        matched[i] = validate(values.iat[i])
+    return matched
+
+
+# Batch validation for bulk onboarding. Columns checked when present: email, phone and
+# password. Returns a frame of (row, field, error), one row per failed check; `first_row`
+# is the number reported for the frame's first record (2 for a CSV under its header).
+def validate_frame(frame, first_row=1):
+    import numpy as np
+    import pandas as pd
+
+    rows = np.arange(first_row, first_row + len(frame))
+    failures = []
+    if "email" in frame:
+        email, ascii_rows = _column(frame, "email")
+        failures.append(("email", "Invalid email address",
+                         ~_matches(email, ascii_rows, EMAIL_PATTERN, validate_email)))
+    if "phone" in frame:
+        phone, ascii_rows = _column(frame, "phone")
+        failures.append(("phone", "Invalid phone number",
+                         ~_matches(phone, ascii_rows, PHONE_PATTERN, validate_phone)))
+    if "password" in frame:
+        password, ascii_rows = _column(frame, "password")
+        present = {LONG_ENOUGH: (password.str.len() >= MIN_PASSWORD_LENGTH).to_numpy(bool, copy=True)}
+        for bit, pattern in _ASCII_CLASS_PATTERNS.items():
+            present[bit] = password.str.contains(pattern).to_numpy(bool, copy=True)
+        for i in (~ascii_rows).nonzero()[0]:
+            properties = check_password(password.iat[i]).properties
+            for bit in present:
+                present[bit][i] = bool(properties & bit)
+        for bit, message in PASSWORD_RULES:
+            failures.append(("password", message, ~present[bit]))
+
+    errors = [
+        pd.DataFrame({"row": rows[failed], "field": field, "error": message})
+        for field, message, failed in failures if failed.any()
+    ]
+    if not errors:
+        return pd.DataFrame({"row": pd.Series(dtype="int64"), "field": pd.Series(dtype=object),
+                             "error": pd.Series(dtype=object)})
+    return pd.concat(errors, ignore_index=True).sort_values(["row", "field"], kind="stable", ignore_index=True)
+
+
+# Validate a CSV of accounts (path or file object) in chunks of `chunksize` records;
+# returns the errors of validate_frame with rows numbered as CSV lines
+def validate_csv(source, chunksize=100_000):
+    import pandas as pd
+
+    errors = []
+    first_row = 2
+    with pd.read_csv(source, dtype=str, keep_default_na=False, chunksize=chunksize) as reader:
+        for chunk in reader:
+            errors.append(validate_frame(chunk, first_row))
+            first_row += len(chunk)
+    if not errors:
+        return validate_frame(pd.DataFrame())
+    return pd.concat(errors, ignore_index=True)
@@ -0,0 +1 @@
+# Page modules; app.py imports each one only when its page is active
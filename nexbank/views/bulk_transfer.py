@@ -0,0 +1,182 @@
+import requests.exceptions
+import streamlit as st
+
+from nexbank import backend, balance, bulk_transfers
+from nexbank.ratelimit import check_rate_limit
+from nexbank.ui import animated_message, show_progress
+
+# Seconds between progress checks while a batch is sending
+PROGRESS_POLL_INTERVAL = 1
+
+
+def _batch():
+    return bulk_transfers.find_batch(st.session_state.bulk_batch, st.session_state.accnumber)
+
+
+def _progress():
+    batch = _batch()
+    if batch is None:
+        return
+    counts = batch.counts()
+    total = len(batch.status)
+    done = counts[bulk_transfers.SENT] + counts[bulk_transfers.FAILED]
+    st.progress(done / total, text=f"{done:,} of {total:,} transfers processed "
+                                   f"({counts[bulk_transfers.SENT]:,} sent, {counts[bulk_transfers.FAILED]:,} failed)")
+    finished = batch.finished_rows()
+    if len(finished):
+        st.dataframe(finished, hide_index=True, use_container_width=True)
+    if batch.state != bulk_transfers.RUNNING and st.session_state.get("bulk_polling"):
+        # The batch stopped; one full rerun stops the polling fragment and offers the results
+        st.session_state.bulk_polling = False
+        st.rerun()
+
+
+# Take what the batch has sent off the shown balance, provisional until the live refresh
+def _apply_sent(batch):
+    sent = batch.take_unapplied()
+    if sent:
+        st.session_state.balance -= sent
+        balance.invalidate(st.session_state.balance_cache, st.session_state.accnumber, st.session_state.balance)
+
+
+def _request_otp(batch, remaining):
+    user_id = st.session_state.accnumber
+    if not check_rate_limit(user_id, "otp_attempts"):
+        st.error("Too many OTP requests. Please try again later.")
+        return
+    first = batch.unsent()[0]
+    loading_placeholder = show_progress("Requesting OTP")
+    try:
+        # One OTP for the batch, requested against its first unsent payee and the total
+        response = backend.post(
+            "/transfer/request-otp",
+            params={
+                "fromAccount": st.session_state.accnumber,
+                "toAccount": batch.rows["to_account"].iat[first],
+                "amount": remaining
+            }
+        )
+        response.raise_for_status()
+        response_data = response.json()
+        st.session_state.loading = False
+        loading_placeholder.empty()
+        if response_data.get("status") == "success":
+            animated_message("OTP sent to your email!")
+            st.session_state.bulk_otp_requested = True
+        else:
+            st.error(f"Failed to request transfer OTP: {response_data.get('message', 'Unknown error')}")
+    except requests.exceptions.HTTPError as e:
+        st.session_state.loading = False
+        loading_placeholder.empty()
+        if e.response.status_code == 400:
+            try:
+                response_data = e.response.json()
+                st.error(f"Failed to request transfer OTP: {response_data.get('message', 'Invalid account or amount')}")
+            except ValueError:
+                st.error("Failed to request transfer OTP: Invalid response from server.")
+        else:
+            st.error(f"Failed to request transfer OTP: {str(e)}")
+    except requests.exceptions.RequestException as e:
+        st.session_state.loading = False
+        loading_placeholder.empty()
+        st.error(f"Failed to request transfer OTP: {str(e)}")
+    except ValueError as e:
+        st.session_state.loading = False
+        loading_placeholder.empty()
+        st.error(f"Failed to request transfer OTP: Invalid JSON response: {str(e)}")
+
+
+def _send_controls(batch, validation):
+    counts = batch.counts()
+    remaining = validation.total - batch.sent_total
+    if counts[bulk_transfers.SENT]:
+        st.info(f"This batch was started before: {counts[bulk_transfers.SENT]:,} of {len(batch.status):,} "
+                f"transfers went through and will not be sent again.")
+    if batch.state == bulk_transfers.PAUSED and batch.message:
+        st.warning(f"{batch.message} Request a new OTP to resume.")
+    if remaining > st.session_state.balance:
+        st.error(f"Bulk transfer failed: the total to send (₹{remaining:,.2f}) exceeds your balance "
+                 f"(₹{st.session_state.balance:,.2f}).")
+        return
+
+    if st.button("Request Transfer OTP", key="bulk_req_otp"):
+        _request_otp(batch, remaining)
+    if st.session_state.bulk_otp_requested:
+        bulk_otp = st.text_input("Enter Transfer OTP", key="bulk_otp")
+        label = "Resume Bulk Transfer" if counts[bulk_transfers.PENDING] < len(batch.status) else "Start Bulk Transfer"
+        if st.button(label, key="bulk_confirm"):
+            if not bulk_otp:
+                st.error("Transfer OTP cannot be empty.")
+            else:
+                # Sends on the async client's loop; this run returns straight away and
+                # the progress below keeps itself updated
+                bulk_transfers.start(batch, st.session_state.token, bulk_otp)
+                st.session_state.bulk_otp_requested = False
+                st.rerun()
+
+
+# Bulk transfer section of the dashboard
+def render():
+    with st.container():
+        st.markdown("""
+        <div style="text-align: center; margin-bottom: 0.5rem;">
+            <p style="font-size: 1.2rem; color: var(--text-color);">
+                Pay many accounts at once from a CSV file, with a single OTP.
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+        st.header("📑 Bulk Transfer")
+        st.caption("One payee per row, with a `to_account` and an `amount` column "
+                   f"(up to {bulk_transfers.BULK_MAX_ROWS:,} rows).")
+        upload = st.file_uploader("Payee CSV", type="csv", key="bulk_csv")
+        if upload is None:
+            return
+        try:
+            validation = bulk_transfers.validate(upload.getvalue(), st.session_state.accnumber)
+        except bulk_transfers.BulkFileError as e:
+            st.error(f"Bulk transfer failed: {str(e)}")
+            return
+        invalid = validation.invalid
+        if len(invalid):
+            st.error(f"{len(invalid):,} of {len(validation.rows):,} rows need fixing before the file can be sent.")
+            st.dataframe(invalid.rename(columns={"row": "Row", "to_account": "To Account", "amount": "Amount",
+                                                 "error": "Problem"}),
+                         hide_index=True, use_container_width=True)
+            return
+        st.write(f"{len(validation.rows):,} payees, ₹{validation.total:,.2f} in total.")
+
+        batch = bulk_transfers.get_batch(validation, st.session_state.accnumber)
+        st.session_state.bulk_batch = batch.id
+        running = batch.state == bulk_transfers.RUNNING
+        if not running:
+            _apply_sent(batch)
+            if batch.closed:
+                counts = batch.counts()
+                if counts[bulk_transfers.SENT] == len(batch.status):
+                    st.info("Every transfer in this file has been sent.")
+                else:
+                    st.info(f"This file was sent before: {counts[bulk_transfers.SENT]:,} of "
+                            f"{len(batch.status):,} transfers went through.")
+            else:
+                _send_controls(batch, validation)
+            if batch.run_id is not None:
+                # A file sent before (e.g. last month's payroll) is sent again as a new
+                # batch, with new idempotency keys
+                if st.button("🔁 Send This File Again as a New Batch", key="bulk_start_over"):
+                    bulk_transfers.start_over(validation, st.session_state.accnumber)
+                    st.session_state.bulk_otp_requested = False
+                    st.rerun()
+
+        st.session_state.bulk_polling = running
+        st.fragment(_progress, run_every=PROGRESS_POLL_INTERVAL if running else None)()
+        if not running and len(batch.finished_rows()):
+            # The file is only written when the button is clicked
+            st.download_button(
+                "⬇️ Download Results",
+                data=batch.results_csv,
+                file_name=f"nexbank-bulk-transfer-{st.session_state.accnumber}-{batch.id[:8]}.csv",
+                mime="text/csv",
+                key="bulk_results",
+                on_click="ignore",
+            )
+        st.markdown('</div>', unsafe_allow_html=True)
@@ -0,0 +1,101 @@
+from importlib import import_module
+
+import streamlit as st
+
+from nexbank import balance, prefetch, session_model
+from nexbank.ui import flash
+
+# Dashboard section -> module under nexbank.views, imported the first time it is opened
+SECTION_MODULES = {
+    "transfer": "transfer",
+    "history": "history_view",
+    "statement": "statement",
+    "bulk_transfer": "bulk_transfer",
+}
+# Seconds between checks of the balance cache; a stale balance is refreshed in the
+# background (nexbank.balance) and picked up on a later check
+BALANCE_POLL_INTERVAL = 5
+
+
+def _balance_panel():
+    value = balance.current(st.session_state.balance_cache, st.session_state.token, st.session_state.accnumber)
+    if value is not None:
+        st.session_state.balance = value
+    st.markdown(f"""
+    <div class="glass-panel" style="text-align: center;">
+        <h3>💰 Account Balance</h3>
+        <h2>₹{st.session_state.balance:,.2f}</h2>
+    </div>
+    """, unsafe_allow_html=True)
+
+
+# Logged-in Dashboard
+def render():
+    cols = st.columns(3)
+    with cols[0]:
+        # Polls the balance cache on its own, so a changed balance (an incoming
+        # transfer, say) replaces the panel without rerunning the page
+        st.fragment(_balance_panel, run_every=BALANCE_POLL_INTERVAL if balance.live() else None)()
+    with cols[1]:
+        st.markdown(f"""
+        <div class="glass-panel" style="text-align: center;">
+            <h3>👤 Account Holder</h3>
+            <p style="font-size: 1.2rem;">{st.session_state.email}</p>
+        </div>
+        """, unsafe_allow_html=True)
+    with cols[2]:
+        st.markdown(f"""
+        <div class="glass-panel" style="text-align: center;">
+            <h3>🔢 Account Number</h3>
+            <p style="font-size: 1.2rem;">{st.session_state.accnumber}</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    quick_cols = st.columns(4)
+    with quick_cols[0]:
+        if st.button("💸 New Transfer", key="quick_transfer"):
+            st.session_state.dashboard_section = "transfer"
+            st.rerun()
+    with quick_cols[1]:
+        if st.button("📜 View History", key="quick_history"):
+            st.session_state.dashboard_section = "history"
+            st.rerun()
+    with quick_cols[2]:
+        if st.button("📧 Send Statement", key="quick_statement"):
+            st.session_state.dashboard_section = "statement"
+            st.rerun()
+    with quick_cols[3]:
+        if st.button("📑 Bulk Transfer", key="quick_bulk_transfer"):
+            st.session_state.dashboard_section = "bulk_transfer"
+            st.rerun()
+
+    if st.session_state.dashboard_section == "welcome":
+        st.markdown("""
+        <div class="glass-panel" style="text-align: center; margin-bottom: 0;">
+            <h3>Welcome to Your Dashboard</h3>
+            <p style="font-size: 1.2rem;">Select an action above to manage your account.</p>
+        </div>
+        """, unsafe_allow_html=True)
+    else:
+        import_module(f"nexbank.views.{SECTION_MODULES[st.session_state.dashboard_section]}").render()
+
+    if st.session_state.dashboard_section != "welcome":
+        with st.container():
+            st.markdown('<div style="margin-top: 0;">', unsafe_allow_html=True)
+            if st.button("← Back to Dashboard"):
+                st.session_state.dashboard_section = "welcome"
+                st.session_state.transfer_otp_requested = False
+                st.session_state.bulk_otp_requested = False
+                st.rerun()
+            st.markdown('</div>', unsafe_allow_html=True)
+
+    with st.container():
+       ## st.markdown('<div class="glass-panel">', unsafe_allow_html=True)
+        if st.button("🚪 Logout", key="logout_btn"):
+            prefetch.cancel(st.session_state.dashboard_prefetch)
+            session_model.forget(st.session_state.session_id)
+            for key in list(st.session_state.keys()):
+                del st.session_state[key]
+            flash("Logged out successfully!")
+            st.rerun()
+        st.markdown('</div>', unsafe_allow_html=True)
@@ -0,0 +1,208 @@
+import requests.exceptions
+import streamlit as st
+
+from nexbank import backend, reference_data
+from nexbank.ratelimit import check_rate_limit
+from nexbank.ui import flash, show_progress
+from nexbank.validators import check_password, password_requirements, validate_password_strength, validate_phone
+
+
+# Forgot Password Flow
+def render():
+    st.header("Forgot Password")
+    if st.session_state.forgot_pwd_stage == 1:
+        with st.form("forgot_init"):
+            st.subheader("Step 1: Verify Account")
+            forgot_acc = st.text_input("Account Number", key="forgot_acc")
+            forgot_phone = st.text_input("Phone Number", key="forgot_phone")
+            if st.form_submit_button("Get Security Question"):
+                if not forgot_acc:
+                    st.error("Account number cannot be empty.")
+                elif not forgot_phone:
+                    st.error("Phone number cannot be empty.")
+                elif not validate_phone(forgot_phone):
+                    st.error("Please enter a valid 10-digit phone number.")
+                else:
+                    loading_placeholder = show_progress("Fetching Security Question")
+                    try:
+                        # Cached process-wide, so repeated attempts do not reach the backend
+                        response_data = reference_data.security_question(forgot_acc, forgot_phone)
+                        st.session_state.loading = False
+                        loading_placeholder.empty()
+                        st.session_state.forgot_data = {
+                            "forgot_acc": forgot_acc,
+                            "forgot_phone": forgot_phone,
+                            "security_question": response_data["question"],
+                            "answer_hash": response_data["answerHash"]
+                        }
+                        flash(f"Security Question: {response_data['question']}")
+                        st.session_state.forgot_pwd_stage = 2
+                        st.rerun()
+                    except reference_data.SecurityQuestionError as e:
+                        st.session_state.loading = False
+                        loading_placeholder.empty()
+                        st.error(f"Failed to retrieve security question: {str(e)}")
+                    except requests.exceptions.HTTPError as e:
+                        st.session_state.loading = False
+                        loading_placeholder.empty()
+                        if e.response.status_code == 404:
+                            st.error("Account not found. Please check your account number or phone number.")
+                        else:
+                            st.error(f"Failed to retrieve security question: {str(e)}")
+                    except requests.exceptions.RequestException as e:
+                        st.session_state.loading = False
+                        loading_placeholder.empty()
+                        st.error(f"Failed to retrieve security question: {str(e)}")
+                    except ValueError as e:
+                        st.session_state.loading = False
+                        loading_placeholder.empty()
+                        st.error(f"Failed to retrieve security question: Invalid JSON response: {str(e)}")
+
+    elif st.session_state.forgot_pwd_stage == 2:
+        with st.form("forgot_verify"):
+            st.subheader("Step 2: Verify Security Answer")
+            forgot_acc = st.session_state.forgot_data.get("forgot_acc", "")
+            forgot_phone = st.session_state.forgot_data.get("forgot_phone", "")
+            security_question = st.session_state.forgot_data.get("security_question", "")
+            st.write(f"Security Question: {security_question}")
+            answer = st.text_input("Your Answer", key="forgot_answer")
+            if st.form_submit_button("Verify Answer"):
+                if not answer:
+                    st.error("Security answer cannot be empty.")
+                else:
+                    user_id = forgot_acc
+                    if not check_rate_limit(user_id, "security_answer_attempts"):
+                        st.error("Too many attempts. Please try again later.")
+                    else:
+                        loading_placeholder = show_progress("Verifying Answer")
+                        try:
+                            response = backend.post(
+                                "/verify-security-answer",
+                                json={"accountNumber": forgot_acc, "answer": answer}
+                            )
+                            response.raise_for_status()
+                            response_data = response.json()
+                            st.session_state.loading = False
+                            loading_placeholder.empty()
+                            if response_data.get("status") == "success":
+                                flash("OTP sent to registered email!")
+                                st.session_state.forgot_pwd_stage = 3
+                                st.rerun()
+                            else:
+                                st.session_state.loading = False
+                                loading_placeholder.empty()
+                                st.error(
+                                    f"Failed to verify security answer: {response_data.get('message', 'Unknown error')}")
+                        except requests.exceptions.HTTPError as e:
+                            st.session_state.loading = False
+                            loading_placeholder.empty()
+                            if e.response.status_code == 400:
+                                try:
+                                    response_data = e.response.json()
+                                    message = response_data.get("message", "Unknown error")
+                                    if "incorrect security answer" in message.lower():
+                                        st.error("Incorrect security answer. Please try again.")
+                                    else:
+                                        st.error(f"Failed to verify security answer: {message}")
+                                except ValueError:
+                                    st.error("Failed to verify security answer: Invalid response from server.")
+                            else:
+                                st.error(f"Failed to verify security answer: {str(e)}")
+                        except requests.exceptions.RequestException as e:
+                            st.session_state.loading = False
+                            loading_placeholder.empty()
+                            st.error(f"Failed to verify security answer: {str(e)}")
+                        except ValueError as e:
+                            st.session_state.loading = False
+                            loading_placeholder.empty()
+                            st.error(f"Failed to verify security answer: Invalid JSON response: {str(e)}")
+
+    elif st.session_state.forgot_pwd_stage == 3:
+        with st.form("forgot_reset"):
+            st.subheader("Step 3: Reset Password")
+            forgot_acc = st.session_state.forgot_data.get("forgot_acc", "")
+            otp = st.text_input("Enter OTP", key="forgot_otp")
+            new_pwd1 = st.text_input("New Password", type="password", key="forgot_pwd1")
+            new_pwd2 = st.text_input("Confirm New Password", type="password", key="forgot_pwd2")
+
+            # One scan per run, shared by the strength meter and the submit check
+            password_check = check_password(new_pwd1)
+            if new_pwd1:
+                progress_html, unmet_requirements = password_requirements(new_pwd1, password_check)
+                st.markdown(progress_html, unsafe_allow_html=True)
+                if unmet_requirements:
+                    st.error("Password does not meet the following requirements:\n- " + "\n- ".join(unmet_requirements))
+
+            if st.form_submit_button("Reset Password"):
+                if not otp:
+                    st.error("OTP cannot be empty.")
+                elif not new_pwd1 or not new_pwd2:
+                    st.error("Password fields cannot be empty.")
+                else:
+                    loading_placeholder = show_progress("Resetting Password")
+                    if new_pwd1 != new_pwd2:
+                        st.session_state.loading = False
+                        loading_placeholder.empty()
+                        st.error("Passwords do not match!")
+                    else:
+                        is_strong, strength_errors = validate_password_strength(new_pwd1, password_check)
+                        if not is_strong:
+                            st.session_state.loading = False
+                            loading_placeholder.empty()
+                            st.error(
+                                "Password does not meet the following requirements:\n- " + "\n- ".join(strength_errors))
+                        else:
+                            try:
+                                response = backend.post(
+                                    "/reset-password",
+                                    json={
+                                        "accountNumber": forgot_acc,
+                                        "otp": otp,
+                                        "newPassword": new_pwd1,
+                                    }
+                                )
+                                response.raise_for_status()
+                                response_data = response.json()
+                                st.session_state.loading = False
+                                loading_placeholder.empty()
+                                if response_data.get("status") == "success":
+                                    reference_data.invalidate_security_question(
+                                        forgot_acc, st.session_state.forgot_data.get("forgot_phone", ""))
+                                    flash("Password reset successful! Redirecting to login...")
+                                    st.session_state.forgot_data = {}
+                                    st.session_state.current_page = "login"
+                                    st.session_state.forgot_pwd_stage = 1
+                                    st.rerun()
+                                else:
+                                    st.session_state.loading = False
+                                    loading_placeholder.empty()
+                                    st.error(f"Password reset failed: {response_data.get('message', 'Unknown error')}")
+                            except requests.exceptions.HTTPError as e:
+                                st.session_state.loading = False
+                                loading_placeholder.empty()
+                                if e.response.status_code == 400:
+                                    try:
+                                        response_data = e.response.json()
+                                        message = response_data.get("message", "Invalid OTP")
+                                        if "otp" in message.lower():
+                                            st.error("Invalid OTP. Please try again.")
+                                        else:
+                                            st.error(f"Password reset failed: {message}")
+                                    except ValueError:
+                                        st.error("Invalid OTP. Please try again.")
+                                else:
+                                    st.error(f"Password reset failed: {str(e)}")
+                            except requests.exceptions.RequestException as e:
+                                st.session_state.loading = False
+                                loading_placeholder.empty()
+                                st.error(f"Password reset failed: {str(e)}")
+                            except ValueError as e:
+                                st.session_state.loading = False
+                                loading_placeholder.empty()
+                                st.error(f"Password reset failed: Invalid JSON response: {str(e)}")
+
+        if st.button("← Back to Main Menu"):
+            st.session_state.forgot_data = {}
+            st.session_state.current_page = "main"
+            st.session_state.forgot_pwd_stage = 1
+            st.rerun()
@@ -0,0 +1,163 @@
+import json
+from datetime import timedelta
+
+import requests.exceptions
+import streamlit as st
+
+from nexbank import history, history_query, prefetch
+from nexbank.ui import show_progress, update_progress
+
+
+# Filter controls over the cached history; returns the matching row positions, newest
+# first. Filters run on the frame's index (nexbank.history_query), never refetching.
+def _filtered_rows(index):
+    with st.expander("🔎 Filter and search"):
+        date_cols = st.columns(2)
+        with date_cols[0]:
+            start = st.date_input("From", value=None, key="history_from")
+        with date_cols[1]:
+            end = st.date_input("To", value=None, key="history_to")
+        search = st.text_input("Counterparty account(s)", key="history_search",
+                               placeholder="e.g. 1234567890, 9876543210")
+        amount_cols = st.columns(2)
+        with amount_cols[0]:
+            min_amount = st.number_input("Min amount", min_value=0.0, value=None, key="history_min")
+        with amount_cols[1]:
+            max_amount = st.number_input("Max amount", min_value=0.0, value=None, key="history_max")
+        statuses = st.multiselect("Status", index.statuses, default=index.statuses, key="history_status")
+
+    accounts = [part.strip() for part in search.replace(",", " ").split() if part.strip()]
+    if any(not account.isdigit() for account in accounts):
+        st.warning("Account numbers can only contain digits; the search was ignored.")
+        accounts = []
+    filters = (start, end, tuple(accounts), min_amount, max_amount, tuple(statuses))
+    if st.session_state.get("history_filters") != filters:
+        # New filters start from the newest match
+        st.session_state.history_filters = filters
+        st.session_state.history_page = 0
+    return history_query.query(
+        index,
+        start=start,
+        end=end + timedelta(days=1) if end else None,
+        counterparties=accounts,
+        min_amount=min_amount,
+        max_amount=max_amount,
+        statuses=statuses,
+    )
+
+
+# Transaction history section of the dashboard; the only page that needs pandas
+def render():
+    with st.container():
+        st.markdown("""
+        <div style="text-align: center; margin-bottom: 0.5rem;">
+            <p style="font-size: 1.2rem; color: var(--text-color);">
+                View your recent transactions here.
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+       ## st.markdown('<div class="glass-panel">', unsafe_allow_html=True)
+        st.header("📜 Transaction History")
+        hist_cols = st.columns(2)
+        with hist_cols[0]:
+            view_clicked = st.button("View Transaction History Live", key="view_history")
+        with hist_cols[1]:
+            refresh_clicked = st.button("🔄 Refresh", key="refresh_history")
+        if (st.session_state.transaction_history is None and not (view_clicked or refresh_clicked)
+                and st.session_state.accnumber in st.session_state.history_cache):
+            # Already cached (by the login prefetch, or an earlier visit to this section);
+            # show it without waiting for a click
+            st.session_state.transaction_history = st.session_state.history_cache[
+                st.session_state.accnumber]["frame"]
+        if view_clicked or refresh_clicked:
+            loading_placeholder = show_progress("Fetching Transaction History")
+            try:
+                # A login prefetch still in flight is joined rather than repeated
+                prefetch.wait(st.session_state.dashboard_prefetch, "history")
+                # Rows are parsed as the response streams in; keep the count on screen
+                st.session_state.transaction_history = history.load_history(
+                    st.session_state.history_cache,
+                    st.session_state.token,
+                    st.session_state.accnumber,
+                    refresh=refresh_clicked,
+                    on_progress=lambda rows: update_progress(
+                        loading_placeholder, f"Fetching Transaction History ({rows:,} received)")
+                )
+                st.session_state.history_page = 0
+                st.session_state.loading = False
+                loading_placeholder.empty()
+            except requests.exceptions.HTTPError as e:
+                st.session_state.loading = False
+                loading_placeholder.empty()
+                if e.response.status_code == 400:
+                    try:
+                        response_data = e.response.json()
+                        st.error(f"Failed to fetch history: {response_data.get('message', 'Invalid request')}")
+                    except ValueError:
+                        st.error("Failed to fetch history: Invalid response from server.")
+                else:
+                    st.error(f"Failed to fetch history: {str(e)}")
+            except requests.exceptions.RequestException as e:
+                st.session_state.loading = False
+                loading_placeholder.empty()
+                st.error(f"Failed to fetch history: {str(e)}")
+            except history.HistoryFormatError as e:
+                st.session_state.loading = False
+                loading_placeholder.empty()
+                st.session_state.transaction_history = None
+                st.error(f"Failed to fetch history: {str(e)}")
+            except ValueError as e:
+                st.session_state.loading = False
+                loading_placeholder.empty()
+                st.error(f"Failed to fetch history: Invalid JSON response: {str(e)}")
+
+        if st.session_state.transaction_history is not None:
+            try:
+                history_frame = st.session_state.transaction_history
+                if history_frame.empty:
+                    st.info("No transaction history available.")
+                else:
+                    entry = st.session_state.history_cache[st.session_state.accnumber]
+                    index = history_query.get_index(entry, st.session_state.accnumber)
+                    positions = _filtered_rows(index)
+                    # Only one window of rows (history.PAGE_SIZE, newest first) is sent to
+                    # the browser; older windows are paged in below
+                    total_pages = history.page_count(len(positions))
+                    page = min(st.session_state.history_page, total_pages - 1)
+                    if len(positions):
+                        st.dataframe(history.page_frame(history_frame, page, positions=positions),
+                                     use_container_width=True)
+                    else:
+                        st.info("No transactions match these filters.")
+                    with st.expander("📊 Monthly inflow / outflow"):
+                        st.caption("Failed transfers are not counted.")
+                        st.dataframe(history_query.monthly_totals(index, positions),
+                                     use_container_width=True, hide_index=True)
+                    malformed = st.session_state.history_cache.get(
+                        st.session_state.accnumber, {}).get("malformed")
+                    if malformed:
+                        st.warning(f"{len(malformed)} transaction(s) could not be read and were skipped "
+                                   f"(first at line {malformed[0].line_number}: {malformed[0].reason}).")
+                    page_cols = st.columns([1, 2, 1])
+                    with page_cols[0]:
+                        if st.button("◀ Newer", key="history_prev", disabled=page == 0):
+                            st.session_state.history_page = page - 1
+                            st.rerun()
+                    with page_cols[1]:
+                        first_row = min(page * history.PAGE_SIZE + 1, len(positions))
+                        last_row = min(page * history.PAGE_SIZE + history.PAGE_SIZE, len(positions))
+                        matched = ""
+                        if len(positions) != len(history_frame):
+                            matched = f" matching ({len(history_frame):,} in all)"
+                        st.markdown(
+                            f'<p style="text-align: center;">Transactions {first_row:,}-{last_row:,} '
+                            f'of {len(positions):,}{matched} (page {page + 1} of {total_pages})</p>',
+                            unsafe_allow_html=True
+                        )
+                    with page_cols[2]:
+                        if st.button("Older ▶", key="history_next", disabled=page >= total_pages - 1):
+                            st.session_state.history_page = page + 1
+                            st.rerun()
+            except (json.JSONDecodeError, ValueError) as e:
+                st.error(f"Failed to parse transaction history: {str(e)}")
+       ## st.markdown('</div>', unsafe_allow_html=True)
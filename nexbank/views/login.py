@@ -0,0 +1,130 @@
+import requests.exceptions
+import streamlit as st
+
+from nexbank import backend, balance, prefetch
+from nexbank.ratelimit import check_rate_limit
+from nexbank.ui import flash, show_progress
+
+
+# Login Flow
+def render():
+    st.header("Login to Your Account")
+    if not st.session_state.show_otp_input:
+        with st.form("login_init"):
+            accnumber = st.text_input("Account Number", key="login_acc")
+            password = st.text_input("Password", type="password", key="login_pwd")
+            if st.form_submit_button("Request OTP"):
+                if not accnumber:
+                    st.error("Account number cannot be empty.")
+                elif not password:
+                    st.error("Password cannot be empty.")
+                else:
+                    user_id = accnumber
+                    if not check_rate_limit(user_id, "otp_attempts"):
+                        st.error("Too many OTP requests. Please try again later.")
+                    else:
+                        loading_placeholder = show_progress("Requesting OTP")
+                        try:
+                            response = backend.post(
+                                "/login/request-otp",
+                                params={"accnumber": accnumber, "password": password}
+                            )
+                            response.raise_for_status()
+                            response_data = response.json()
+                            st.session_state.loading = False
+                            loading_placeholder.empty()
+                            if response_data.get("status") == "success":
+                                st.session_state.login_data = {"accnumber": accnumber, "password": password}
+                                flash("OTP sent to registered email!")
+                                st.session_state.show_otp_input = True
+                                st.rerun()
+                            else:
+                                st.session_state.loading = False
+                                loading_placeholder.empty()
+                                st.error(f"Login failed: {response_data.get('message', 'Unknown error')}")
+                        except requests.exceptions.HTTPError as e:
+                            st.session_state.loading = False
+                            loading_placeholder.empty()
+                            if e.response.status_code == 400:
+                                try:
+                                    response_data = e.response.json()
+                                    st.error(
+                                        f"Login failed: {response_data.get('message', 'Invalid account number or password')}")
+                                except ValueError:
+                                    st.error("Login failed: Invalid response from server.")
+                            else:
+                                st.error(f"Login failed: {str(e)}")
+                        except requests.exceptions.RequestException as e:
+                            st.session_state.loading = False
+                            loading_placeholder.empty()
+                            st.error(f"Login failed: {str(e)}")
+                        except ValueError as e:
+                            st.session_state.loading = False
+                            loading_placeholder.empty()
+                            st.error(f"Login failed: Invalid JSON response: {str(e)}")
+    else:
+        with st.form("login_verify"):
+            otp = st.text_input("Enter OTP", key="login_otp")
+            login_accnumber = st.session_state.login_data.get("accnumber", "")
+            login_password = st.session_state.login_data.get("password", "")
+            if st.form_submit_button("Verify OTP"):
+                if not otp:
+                    st.error("OTP cannot be empty.")
+                else:
+                    loading_placeholder = show_progress("Verifying OTP")
+                    try:
+                        verify_response = backend.post(
+                            "/login/verify",
+                            params={"accnumber": login_accnumber, "password": login_password, "otp": otp}
+                        )
+                        verify_response.raise_for_status()
+                        response_data = verify_response.json()
+                        st.session_state.loading = False
+                        loading_placeholder.empty()
+                        if response_data.get("status") == "success":
+                            st.session_state.token = response_data["token"]
+                            st.session_state.accnumber = response_data["accnumber"]
+                            st.session_state.email = response_data["email"]
+                            st.session_state.balance = response_data["balance"]
+                            balance.seed(st.session_state.balance_cache, st.session_state.accnumber,
+                                         st.session_state.balance)
+                            st.session_state.login_data = {}
+                            st.session_state.dashboard_prefetch = prefetch.start_dashboard({
+                                "token": st.session_state.token,
+                                "accnumber": st.session_state.accnumber,
+                                "session_id": st.session_state.session_id,
+                                "history_cache": st.session_state.history_cache,
+                                "balance_cache": st.session_state.balance_cache,
+                            })
+                            flash("Login successful! Redirecting to dashboard...")
+                            st.session_state.current_page = "main"
+                            st.rerun()
+                        else:
+                            st.session_state.loading = False
+                            loading_placeholder.empty()
+                            st.error(f"Verification failed: {response_data.get('message', 'Unknown error')}")
+                    except requests.exceptions.HTTPError as e:
+                        st.session_state.loading = False
+                        loading_placeholder.empty()
+                        if e.response.status_code == 400:
+                            try:
+                                response_data = e.response.json()
+                                st.error(f"Verification failed: {response_data.get('message', 'Invalid OTP')}")
+                            except ValueError:
+                                st.error("Verification failed: Invalid response from server.")
+                        else:
+                            st.error(f"Verification failed: {str(e)}")
+                    except requests.exceptions.RequestException as e:
+                        st.session_state.loading = False
+                        loading_placeholder.empty()
+                        st.error(f"Verification failed: {str(e)}")
+                    except ValueError as e:
+                        st.session_state.loading = False
+                        loading_placeholder.empty()
+                        st.error(f"Verification failed: Invalid JSON response: {str(e)}")
+
+    if st.button("← Back to Main Menu"):
+        st.session_state.login_data = {}
+        st.session_state.current_page = "main"
+        st.session_state.show_otp_input = False
+        st.rerun()
@@ -0,0 +1,81 @@
+import streamlit as st
+
+from nexbank import warmup
+
+# Seconds between readiness checks while the backend is waking up
+STATUS_POLL_INTERVAL = 3
+BACKEND_STATUS_MESSAGES = {
+    warmup.WAKING: "⏳ Our servers are waking up. Your first request may take up to a minute.",
+    warmup.UNREACHABLE: "⚠️ Our servers are not responding right now. Please try again in a few minutes.",
+}
+WAKING_HELP = "The backend is still waking up, so this may take a little longer than usual."
+
+
+def _backend_status():
+    message = BACKEND_STATUS_MESSAGES.get(warmup.status())
+    if message:
+        st.info(message)
+    elif st.session_state.get("backend_polling"):
+        # Backend is ready; one full rerun stops the polling fragment and the button hints
+        st.session_state.backend_polling = False
+        st.rerun()
+
+
+# Main Menu (shown when not logged in)
+def render():
+    with st.container():
+        st.markdown("""
+        <div class="hero-container">
+            <h2 style="color: var(--secondary); margin-bottom: 1.5rem; text-shadow: 0 0 10px rgba(0, 212, 255, 0.5);">
+                Next-Gen Banking Awaits
+            </h2>
+            <p class="hero-text">
+                Experience banking reimagined with our cutting-edge platform that combines 
+                <span style="color: var(--neon-glow); font-weight: 600;">quantum-grade security</span>, 
+                <span style="color: var(--neon-glow); font-weight: 600;">lightning-fast transactions</span>, and 
+                <span style="color: var(--neon-glow); font-weight: 600;">seamless accessibility</span>.
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    st.markdown("""
+    <div class="feature-container">
+        <div class="feature-card">
+            <div class="feature-icon">🔒</div>
+            <h3>Quantum Security</h3>
+            <p>Hashed OTPs with env-secured credentials and rate-limiting</p>
+        </div>
+        <div class="feature-card">
+            <div class="feature-icon">⚡</div>
+            <h3>Lightning Transfers</h3>
+            <p>Instant global transactions with near-zero latency</p>
+        </div>
+        <div class="feature-card">
+            <div class="feature-icon">🌌</div>
+            <h3>Cosmic Access</h3>
+            <p>Bank from anywhere with our space-grade infrastructure</p>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Readiness from the process-wide warm-up pinger (nexbank.warmup)
+    waking = not warmup.is_ready()
+    st.session_state.backend_polling = waking
+    st.fragment(_backend_status, run_every=STATUS_POLL_INTERVAL if waking else None)()
+    button_help = WAKING_HELP if waking else None
+
+    col1, col2, col3 = st.columns([1, 1, 1])
+    with col1:
+        if st.button("📝 Registration", key="reg_btn", help=button_help):
+            st.session_state.current_page = "register"
+            st.session_state.reg_stage = 1
+            st.rerun()
+    with col2:
+        if st.button("🔐 Login", key="login_btn", help=button_help):
+            st.session_state.current_page = "login"
+            st.rerun()
+    with col3:
+        if st.button("🔑 Forgot Password", key="forgot_btn", help=button_help):
+            st.session_state.current_page = "forgot_pwd"
+            st.session_state.forgot_pwd_stage = 1
+            st.rerun()
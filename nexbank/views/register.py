@@ -0,0 +1,170 @@
+import requests.exceptions
+import streamlit as st
+
+from nexbank import backend, reference_data
+from nexbank.ratelimit import check_rate_limit
+from nexbank.ui import flash, show_progress
+from nexbank.validators import check_password, password_requirements, validate_email, validate_password_strength
+
+
+# Registration Flow
+def render():
+    st.header("New Account Registration")
+    if st.session_state.reg_stage == 1:
+        with st.form("reg_init"):
+            st.subheader("Step 1: Account Details")
+            reg_acc = st.text_input("Account Number", key="reg_acc")
+            reg_email_input = st.text_input("Email Address", key="reg_email")
+            if st.form_submit_button("Send Verification OTP"):
+                if not reg_acc:
+                    st.error("Account number cannot be empty.")
+                elif not reg_email_input:
+                    st.error("Email address cannot be empty.")
+                elif not validate_email(reg_email_input):
+                    st.error("Please enter a valid email address.")
+                else:
+                    user_id = reg_acc
+                    if not check_rate_limit(user_id, "otp_attempts"):
+                        st.error("Too many OTP requests. Please try again later.")
+                    else:
+                        loading_placeholder = show_progress("Requesting OTP")
+                        try:
+                            response = backend.post(
+                                "/register/init",
+                                params={"accountNumber": reg_acc, "email": reg_email_input}
+                            )
+                            response.raise_for_status()
+                            response_data = response.json()
+                            st.session_state.loading = False
+                            loading_placeholder.empty()
+                            if response_data.get("status") == "success":
+                                st.session_state.reg_data = {"reg_acc": reg_acc, "reg_email": reg_email_input}
+                                flash("OTP sent to registered email!")
+                                st.session_state.reg_stage = 2
+                                st.rerun()
+                            else:
+                                st.session_state.loading = False
+                                loading_placeholder.empty()
+                                st.error(f"Registration failed: {response_data.get('message', 'Unknown error')}")
+                        except requests.exceptions.HTTPError as e:
+                            st.session_state.loading = False
+                            loading_placeholder.empty()
+                            if e.response.status_code == 400:
+                                try:
+                                    response_data = e.response.json()
+                                    st.error(
+                                        f"Registration failed: {response_data.get('message', 'Invalid account number or email')}")
+                                except ValueError:
+                                    st.error("Registration failed: Invalid response from server.")
+                            else:
+                                st.error(f"Registration failed: {str(e)}")
+                        except requests.exceptions.RequestException as e:
+                            st.session_state.loading = False
+                            loading_placeholder.empty()
+                            st.error(f"Registration failed: {str(e)}")
+                        except ValueError as e:
+                            st.session_state.loading = False
+                            loading_placeholder.empty()
+                            st.error(f"Registration failed: Invalid JSON response: {str(e)}")
+
+    elif st.session_state.reg_stage == 2:
+        with st.form("reg_complete"):
+            st.subheader("Step 2: Complete Registration")
+            reg_acc = st.session_state.reg_data.get("reg_acc", "")
+            reg_email = st.session_state.reg_data.get("reg_email", "")
+            reg_otp = st.text_input("Verification OTP", key="reg_otp")
+            sec_question = st.selectbox(
+                "Security Question",
+                reference_data.SECURITY_QUESTIONS,
+                index=0,
+                key="sec_question"
+            )
+            security_question_choice = reference_data.QUESTION_CHOICES[sec_question]
+            sec_answer = st.text_input("Security Answer", key="sec_answer")
+            pwd1 = st.text_input("Password", type="password", key="reg_pwd1")
+            pwd2 = st.text_input("Confirm Password", type="password", key="reg_pwd2")
+
+            # One scan per run, shared by the strength meter and the submit check
+            password_check = check_password(pwd1)
+            if pwd1:
+                progress_html, unmet_requirements = password_requirements(pwd1, password_check)
+                st.markdown(progress_html, unsafe_allow_html=True)
+                if unmet_requirements:
+                    st.error("Password does not meet the following requirements:\n- " + "\n- ".join(unmet_requirements))
+
+            if st.form_submit_button("Complete Registration"):
+                if not reg_otp:
+                    st.error("OTP cannot be empty.")
+                elif not sec_answer:
+                    st.error("Security answer cannot be empty.")
+                elif not pwd1 or not pwd2:
+                    st.error("Password fields cannot be empty.")
+                else:
+                    loading_placeholder = show_progress("Completing Registration")
+                    if pwd1 != pwd2:
+                        st.session_state.loading = False
+                        loading_placeholder.empty()
+                        st.error("Passwords do not match!")
+                    else:
+                        is_strong, strength_errors = validate_password_strength(pwd1, password_check)
+                        if not is_strong:
+                            st.session_state.loading = False
+                            loading_placeholder.empty()
+                            st.error(
+                                "Password does not meet the following requirements:\n- " + "\n- ".join(strength_errors))
+                        else:
+                            try:
+                                response = backend.post(
+                                    "/register/complete",
+                                    params={
+                                        "accountNumber": reg_acc,
+                                        "otp": reg_otp,
+                                        "securityQuestionChoice": security_question_choice,
+                                        "securityAnswer": sec_answer,
+                                        "password1": pwd1,
+                                        "password2": pwd2,
+                                        "email": reg_email
+                                    }
+                                )
+                                response.raise_for_status()
+                                response_data = response.json()
+                                st.session_state.loading = False
+                                loading_placeholder.empty()
+                                if response_data.get("status") == "success":
+                                    # The account's security question may have changed
+                                    reference_data.invalidate_security_question()
+                                    flash("Registration successful! Redirecting to main menu...")
+                                    st.session_state.reg_data = {}
+                                    st.session_state.current_page = "main"
+                                    st.session_state.reg_stage = 1
+                                    st.rerun()
+                                else:
+                                    st.session_state.loading = False
+                                    loading_placeholder.empty()
+                                    st.error(f"Registration failed: {response_data.get('message', 'Unknown error')}")
+                            except requests.exceptions.HTTPError as e:
+                                st.session_state.loading = False
+                                loading_placeholder.empty()
+                                if e.response.status_code == 400:
+                                    try:
+                                        response_data = e.response.json()
+                                        st.error(
+                                            f"Registration failed: {response_data.get('message', 'Invalid OTP or security answer')}")
+                                    except ValueError:
+                                        st.error("Registration failed: Invalid response from server.")
+                                else:
+                                    st.error(f"Registration failed: {str(e)}")
+                            except requests.exceptions.RequestException as e:
+                                st.session_state.loading = False
+                                loading_placeholder.empty()
+                                st.error(f"Registration failed: {str(e)}")
+                            except ValueError as e:
+                                st.session_state.loading = False
+                                loading_placeholder.empty()
+                                st.error(f"Registration failed: Invalid JSON response: {str(e)}")
+
+        if st.button("← Back to Main Menu"):
+            st.session_state.reg_data = {}
+            st.session_state.current_page = "main"
+            st.session_state.reg_stage = 1
+            st.rerun()
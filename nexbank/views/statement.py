@@ -0,0 +1,121 @@
+import requests.exceptions
+import streamlit as st
+
+from nexbank import history, jobs, prefetch, statement_export
+from nexbank.ui import show_progress
+
+# Seconds between status checks while a statement job is still pending
+STATUS_POLL_INTERVAL = 2
+# Jobs listed under the form, newest first
+MAX_LISTED_JOBS = 5
+
+
+def _job_status():
+    job_ids = st.session_state.statement_jobs[:MAX_LISTED_JOBS]
+    pending = False
+    for job_id in job_ids:
+        job = jobs.get_job(job_id)
+        if job is None:
+            continue
+        _, month, year = job.key
+        if job.status == jobs.DONE:
+            st.markdown(f'<div class="success-message" style="animation: none;">'
+                        f'Statement for {month:02d}/{year} sent to {st.session_state.email}!</div>',
+                        unsafe_allow_html=True)
+        elif job.status == jobs.FAILED:
+            st.error(f"{month:02d}/{year}: {job.message}")
+        else:
+            pending = True
+            st.info(f"⏳ Statement for {month:02d}/{year} is being prepared ({job.status})...")
+    if not pending and st.session_state.get("statement_polling"):
+        # Everything finished; one full rerun stops the polling fragment
+        st.session_state.statement_polling = False
+        st.rerun()
+
+
+# Cached history entry for the statement download, fetched here if this session has none
+def _history_entry():
+    entry = st.session_state.history_cache.get(st.session_state.accnumber)
+    if entry is not None:
+        return entry
+    loading_placeholder = show_progress("Fetching Transaction History")
+    try:
+        # A login prefetch still in flight is joined rather than repeated
+        prefetch.wait(st.session_state.dashboard_prefetch, "history")
+        if st.session_state.accnumber not in st.session_state.history_cache:
+            history.load_history(st.session_state.history_cache, st.session_state.token,
+                                 st.session_state.accnumber)
+        return st.session_state.history_cache[st.session_state.accnumber]
+    except requests.exceptions.RequestException as e:
+        st.error(f"Statement download unavailable: {str(e)}")
+    except ValueError as e:
+        st.error(f"Statement download unavailable: Invalid response: {str(e)}")
+    finally:
+        st.session_state.loading = False
+        loading_placeholder.empty()
+    return None
+
+
+def _download(month, year):
+    entry = _history_entry()
+    if entry is None:
+        return
+    statement = statement_export.month_statement(entry, st.session_state.accnumber, month, year)
+    st.caption(f"{len(statement.rows):,} transactions in {month:02d}/{year} from your cached history "
+               f"(inflow ₹{statement.inflow:,.2f}, outflow ₹{statement.outflow:,.2f}; failed transfers "
+               f"are listed but not counted).")
+    fmt = st.radio("Format", statement_export.available_formats(), horizontal=True, key="statement_format")
+    # The file is only written when the button is clicked
+    st.download_button(
+        f"⬇️ Download {fmt}",
+        data=lambda: statement_export.export(statement, fmt),
+        file_name=statement_export.file_name(statement, fmt),
+        mime=statement_export.FORMATS[fmt][1],
+        key="statement_download",
+        on_click="ignore",
+    )
+
+
+# Statement section of the dashboard
+def render():
+    with st.container():
+        st.markdown("""
+        <div style="text-align: center; margin-bottom: 0.5rem;">
+            <p style="font-size: 1.2rem; color: var(--text-color);">
+                Download a monthly statement, or have one emailed to you.
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+      ##  st.markdown('<div class="glass-panel">', unsafe_allow_html=True)
+        st.header("📄 Account Statement")
+        period_cols = st.columns(2)
+        with period_cols[0]:
+            month = st.number_input("Month (1-12)", min_value=1, max_value=12, step=1, key="statement_month")
+        with period_cols[1]:
+            year = st.number_input("Year", min_value=2025, max_value=2026, step=1, key="statement_year")
+        month, year = int(month), int(year)
+
+        # Built here from the history this session already holds; the backend's emailed
+        # statement is only requested from the form below
+        _download(month, year)
+
+        st.subheader("📧 Send Statement via Email")
+        with st.form("send_statement_form"):
+            st.write(f"Email the {month:02d}/{year} statement to {st.session_state.email}.")
+            if st.form_submit_button("Send Statement"):
+                # The backend builds and emails the statement on a shared worker pool, so
+                # this run returns straight away and the status below keeps itself updated
+                job_id = jobs.submit_statement(
+                    st.session_state.token, st.session_state.accnumber, month, year)
+                if job_id in st.session_state.statement_jobs:
+                    st.info("A statement for that month is already being prepared.")
+                else:
+                    st.session_state.statement_jobs.insert(0, job_id)
+
+        pending = any(
+            job is not None and job.status not in jobs.FINISHED
+            for job in map(jobs.get_job, st.session_state.statement_jobs[:MAX_LISTED_JOBS])
+        )
+        st.session_state.statement_polling = pending
+        st.fragment(_job_status, run_every=STATUS_POLL_INTERVAL if pending else None)()
+        st.markdown('</div>', unsafe_allow_html=True)
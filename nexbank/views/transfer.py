@@ -0,0 +1,155 @@
+import requests.exceptions
+import streamlit as st
+
+from nexbank import backend, balance, transfers
+from nexbank.ratelimit import check_rate_limit
+from nexbank.ui import animated_message, flash, show_progress
+
+
+# Transfer funds section of the dashboard
+def render():
+    with st.container():
+        st.markdown("""
+        <div style="text-align: center; margin-bottom: 0.5rem;">
+            <p style="font-size: 1.2rem; color: var(--text-color);">
+                Securely transfer funds to any account.
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+      ##  st.markdown('<div class="glass-panel">', unsafe_allow_html=True)
+        st.header("💸 Transfer Funds")
+        to_account = st.text_input("To Account Number", key="transfer_to")
+        amount = st.number_input("Amount", min_value=0.01, key="transfer_amount")
+
+        if st.button("Request Transfer OTP", key="transfer_req_otp"):
+            if not to_account:
+                st.error("To account number cannot be empty.")
+            elif amount <= 0:
+                st.error("Amount must be greater than 0.")
+            else:
+                user_id = st.session_state.accnumber
+                if not check_rate_limit(user_id, "otp_attempts"):
+                    st.error("Too many OTP requests. Please try again later.")
+                else:
+                    loading_placeholder = show_progress("Requesting OTP")
+                    try:
+                        response = backend.post(
+                            "/transfer/request-otp",
+                            params={
+                                "fromAccount": st.session_state.accnumber,
+                                "toAccount": to_account,
+                                "amount": amount
+                            }
+                        )
+                        response.raise_for_status()
+                        response_data = response.json()
+                        st.session_state.loading = False
+                        loading_placeholder.empty()
+                        if response_data.get("status") == "success":
+                            animated_message("OTP sent to your email!")
+                            st.session_state.transfer_otp_requested = True
+                            st.session_state.transfer_otp_request_id = transfers.new_otp_request_id()
+                        else:
+                            st.session_state.loading = False
+                            loading_placeholder.empty()
+                            st.error(
+                                f"Failed to request transfer OTP: {response_data.get('message', 'Unknown error')}")
+                    except requests.exceptions.HTTPError as e:
+                        st.session_state.loading = False
+                        loading_placeholder.empty()
+                        if e.response.status_code == 400:
+                            try:
+                                response_data = e.response.json()
+                                st.error(
+                                    f"Failed to request transfer OTP: {response_data.get('message', 'Invalid account or amount')}")
+                            except ValueError:
+                                st.error("Failed to request transfer OTP: Invalid response from server.")
+                        else:
+                            st.error(f"Failed to request transfer OTP: {str(e)}")
+                    except requests.exceptions.RequestException as e:
+                        st.session_state.loading = False
+                        loading_placeholder.empty()
+                        st.error(f"Failed to request transfer OTP: {str(e)}")
+                    except ValueError as e:
+                        st.session_state.loading = False
+                        loading_placeholder.empty()
+                        st.error(f"Failed to request transfer OTP: Invalid JSON response: {str(e)}")
+
+        if st.session_state.transfer_otp_requested:
+            transfer_otp = st.text_input("Enter Transfer OTP", key="transfer_otp")
+            if st.button("Confirm Transfer", key="transfer_confirm"):
+                if not transfer_otp:
+                    st.error("Transfer OTP cannot be empty.")
+                else:
+                    loading_placeholder = show_progress("Confirming Transfer")
+                    payload = {
+                        "fromAccount": st.session_state.accnumber,
+                        "toAccount": to_account,
+                        "amount": amount,
+                        "otp": transfer_otp
+                    }
+                    key = transfers.idempotency_key(
+                        st.session_state.accnumber, to_account, amount,
+                        st.session_state.transfer_otp_request_id
+                    )
+                    try:
+                        response_data, replayed = transfers.submit_transfer(
+                            st.session_state.token, payload, key)
+                        st.session_state.loading = False
+                        loading_placeholder.empty()
+                        if response_data.get("status") == "success":
+                            # Take the balance from the server; subtract locally only when the
+                            # response carries none, and only once per transfer, whether this
+                            # run or an earlier one cut short by a rerun gets the response
+                            new_balance = transfers.balance_from_response(response_data)
+                            if new_balance is not None:
+                                st.session_state.balance = new_balance
+                                balance.seed(st.session_state.balance_cache,
+                                             st.session_state.accnumber, new_balance)
+                            else:
+                                if transfers.claim_debit(key):
+                                    st.session_state.balance -= amount
+                                # Provisional until the live refresh confirms it
+                                balance.invalidate(st.session_state.balance_cache,
+                                                   st.session_state.accnumber, st.session_state.balance)
+                            st.session_state.transfer_otp_requested = False
+                            st.session_state.transfer_otp_request_id = None
+                            if replayed:
+                                flash("✅ This transfer was already completed. It was not sent again.")
+                            else:
+                                flash("✅ Transfer successful! Balance updated.")
+                                st.balloons()
+                            st.session_state.dashboard_section = "welcome"
+                            st.rerun()
+                        else:
+                            st.session_state.loading = False
+                            loading_placeholder.empty()
+                            st.error(f"Transfer failed: {response_data.get('message', 'Unknown error')}")
+                    except transfers.TransferInFlight:
+                        st.session_state.loading = False
+                        loading_placeholder.empty()
+                        st.info("This transfer is already being processed. Please wait.")
+                    except requests.exceptions.HTTPError as e:
+                        st.session_state.loading = False
+                        loading_placeholder.empty()
+                        if e.response.status_code == 400:
+                            try:
+                                response_data = e.response.json()
+                                message = response_data.get("message", "Unknown error")
+                                if "fraudulent" in message.lower():
+                                    st.error("Transaction failed: Fraud detected by ML model.")
+                                else:
+                                    st.error(f"Transfer failed: {message}")
+                            except ValueError:
+                                st.error("Transfer failed: Invalid response from server.")
+                        else:
+                            st.error(f"Transfer failed: {str(e)}")
+                    except requests.exceptions.RequestException as e:
+                        st.session_state.loading = False
+                        loading_placeholder.empty()
+                        st.error(f"Transfer failed: {str(e)}")
+                    except ValueError as e:
+                        st.session_state.loading = False
+                        loading_placeholder.empty()
+                        st.error(f"Transfer failed: Invalid JSON response: {str(e)}")
+        st.markdown('</div>', unsafe_allow_html=True)
@@ -0,0 +1,64 @@
+import os
+import threading
+import time
+
+from nexbank import backend
+
+# Wakes an idle backend (a free Render instance can take tens of seconds to cold start)
+# and keeps it and the pooled connections warm. One pinger runs per server process,
+# shared by every session.
+
+# Seconds between keep-alive pings once the backend answered; 0 pings only at startup
+KEEPALIVE_INTERVAL = float(os.environ.get("NEXBANK_KEEPALIVE_INTERVAL", "600"))
+# Seconds between pings while the backend is still waking up
+WAKE_RETRY_INTERVAL = 5.0
+# Failed pings in a row before the backend is reported unreachable rather than waking
+UNREACHABLE_AFTER = 3
+# Concurrent pings per instance, i.e. sockets left open in the pool
+WARMUP_CONNECTIONS = int(os.environ.get("NEXBANK_WARMUP_CONNECTIONS", "2"))
+# (connect, read) timeout for a ping; the read timeout covers a cold start
+WARMUP_TIMEOUT = (10.0, 90.0)
+
+WAKING = "waking"
+READY = "ready"
+UNREACHABLE = "unreachable"
+
+_status = WAKING
+_started = False
+_lock = threading.Lock()
+
+
+def status():
+    return _status
+
+
+def is_ready():
+    return _status == READY
+
+
+def _run():
+    global _status
+    failures = 0
+    while True:
+        if backend.check_all(WARMUP_TIMEOUT, WARMUP_CONNECTIONS):
+            failures = 0
+            _status = READY
+            if not KEEPALIVE_INTERVAL:
+                return
+            time.sleep(KEEPALIVE_INTERVAL)
+        else:
+            failures += 1
+            _status = UNREACHABLE if failures >= UNREACHABLE_AFTER else WAKING
+            time.sleep(WAKE_RETRY_INTERVAL)
+
+
+# Start the pinger once per process; later calls do nothing
+def start():
+    global _started
+    if _started:
+        return
+    with _lock:
+        if _started:
+            return
+        _started = True
+    threading.Thread(target=_run, name="nexbank-warmup", daemon=True).start()
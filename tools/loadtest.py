@@ -0,0 +1,156 @@
+# Headless load driver: N concurrent simulated users run login -> transfer -> history
+# through the real Streamlit script (streamlit.testing AppTest) against a backend, and
+# the p50/p95/p99 latency of each flow is reported.
+#
+#   python tools/loadtest.py --users 20 --iterations 3 --mock-latency 0.05
+#   python tools/loadtest.py --users 20 --backend-url http://127.0.0.1:8765
+#
+# Without --backend-url the bundled mock backend (tools/mock_backend.py) is started
+# in-process. Each simulated user runs in its own process: AppTest drives a process-wide
+# Streamlit runtime, so concurrent scripts in one process would trip over each other.
+import argparse
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import mock_backend
+
+APP_SCRIPT = os.path.join(ROOT, "app.py")
+FLOWS = ("login", "transfer", "history")
+
+
+class FlowError(Exception):
+    pass
+
+
+def _check(at, flow):
+    if at.exception:
+        raise FlowError(f"{flow}: {at.exception[0].value}")
+    if at.error:
+        raise FlowError(f"{flow}: {at.error[0].value}")
+
+
+def _button(at, label):
+    for button in at.button:
+        if button.label == label:
+            return button
+    raise FlowError(f"button {label!r} not found")
+
+
+def login(at, accnumber):
+    at.button(key="login_btn").click().run()
+    at.text_input(key="login_acc").input(accnumber)
+    at.text_input(key="login_pwd").input(mock_backend.DEFAULT_PASSWORD)
+    _button(at, "Request OTP").click().run()
+    _check(at, "login")
+    at.text_input(key="login_otp").input(mock_backend.MOCK_OTP)
+    _button(at, "Verify OTP").click().run()
+    _check(at, "login")
+    if not at.session_state["token"]:
+        raise FlowError("login: no token")
+
+
+def transfer(at, to_account):
+    at.button(key="quick_transfer").click().run()
+    at.text_input(key="transfer_to").input(to_account)
+    at.number_input(key="transfer_amount").set_value(10.0)
+    at.button(key="transfer_req_otp").click().run()
+    _check(at, "transfer")
+    at.text_input(key="transfer_otp").input(mock_backend.MOCK_OTP)
+    at.button(key="transfer_confirm").click().run()
+    _check(at, "transfer")
+
+
+def history(at):
+    at.button(key="quick_history").click().run()
+    at.button(key="view_history").click().run()
+    _check(at, "history")
+    if not at.dataframe and not at.info:
+        raise FlowError("history: nothing rendered")
+
+
+# One simulated user; returns ({flow: [seconds]}, {flow: [error]})
+def run_user(user, iterations, timeout):
+    from streamlit.testing.v1 import AppTest
+
+    results = {flow: [] for flow in FLOWS}
+    errors = {flow: [] for flow in FLOWS}
+    for iteration in range(iterations):
+        # Distinct accounts per iteration keep the shared OTP rate limit out of the way
+        accnumber = str(5000000000 + user * 1000 + iteration)
+        at = AppTest.from_file(APP_SCRIPT, default_timeout=timeout).run()
+        for flow, step in (("login", lambda: login(at, accnumber)),
+                           ("transfer", lambda: transfer(at, str(6000000000 + user))),
+                           ("history", lambda: history(at))):
+            start = time.perf_counter()
+            try:
+                step()
+            except Exception as e:
+                errors[flow].append(str(e))
+                break
+            results[flow].append(time.perf_counter() - start)
+    return results, errors
+
+
+def percentile(values, pct):
+    if not values:
+        return float("nan")
+    ordered = sorted(values)
+    rank = max(0, math.ceil(pct / 100 * len(ordered)) - 1)
+    return ordered[rank]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test app.py with simulated users")
+    parser.add_argument("--users", type=int, default=10, help="concurrent simulated users")
+    parser.add_argument("--iterations", type=int, default=1, help="login -> transfer -> history runs per user")
+    parser.add_argument("--backend-url", help="backend to test against; default starts the mock in-process")
+    parser.add_argument("--mock-latency", type=float, default=0.05, help="mock latency per request, seconds")
+    parser.add_argument("--mock-jitter", type=float, default=0.02)
+    parser.add_argument("--mock-error-rate", type=float, default=0.0)
+    parser.add_argument("--mock-history-rows", type=int, default=200)
+    parser.add_argument("--timeout", type=float, default=120.0, help="per-run AppTest timeout, seconds")
+    args = parser.parse_args()
+
+    if args.backend_url:
+        backend_url = args.backend_url
+    else:
+        server = mock_backend.start(mock_backend.MockConfig(
+            latency=args.mock_latency, jitter=args.mock_jitter, error_rate=args.mock_error_rate,
+            history_rows=args.mock_history_rows))
+        backend_url = f"http://127.0.0.1:{server.server_address[1]}"
+    # Read by nexbank.backend on import, which happens inside each worker's first run
+    os.environ["NEXBANK_BACKEND_URL"] = backend_url
+
+    results = {flow: [] for flow in FLOWS}
+    errors = {flow: [] for flow in FLOWS}
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.users) as pool:
+        futures = [pool.submit(run_user, user, args.iterations, args.timeout) for user in range(args.users)]
+        for future in futures:
+            user_results, user_errors = future.result()
+            for flow in FLOWS:
+                results[flow].extend(user_results[flow])
+                errors[flow].extend(user_errors[flow])
+    elapsed = time.perf_counter() - start
+
+    print(f"backend {backend_url}, {args.users} users x {args.iterations} iterations in {elapsed:.1f}s")
+    print(f"{'flow':<10} {'ok':>5} {'errors':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for flow in FLOWS:
+        values = results[flow]
+        print(f"{flow:<10} {len(values):>5} {len(errors[flow]):>6} "
+              f"{percentile(values, 50) * 1000:>9.1f} {percentile(values, 95) * 1000:>9.1f} "
+              f"{percentile(values, 99) * 1000:>9.1f}")
+    for flow in FLOWS:
+        for message in errors[flow][:3]:
+            print(f"  {flow} error: {message}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,320 @@
+# Local stand-in for the Nex Bank backend, covering every endpoint app.py calls (plus the
+# /get-balance endpoint nexbank.balance polls, with ETag support).
+# Latency and errors can be injected per endpoint so the front end can be load tested
+# without touching the live service.
+#
+#   python tools/mock_backend.py --port 8765 --latency 0.05 --error-rate 0.01
+#   NEXBANK_BACKEND_URL=http://127.0.0.1:8765 streamlit run app.py
+#
+# Any account number works; accounts are created on first use with DEFAULT_PASSWORD
+# and every OTP is MOCK_OTP.
+import argparse
+import hashlib
+import json
+import random
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+MOCK_OTP = "123456"
+DEFAULT_PASSWORD = "Passw0rd!"
+SECURITY_QUESTION = "What is your pet's name?"
+SECURITY_ANSWER = "fluffy"
+STARTING_BALANCE = 100000.0
+
+ENDPOINTS = (
+    "/register/init",
+    "/register/complete",
+    "/login/request-otp",
+    "/login/verify",
+    "/get-security-question",
+    "/verify-security-answer",
+    "/reset-password",
+    "/transfer/request-otp",
+    "/transfer",
+    "/get-transaction-history",
+    "/get-balance",
+    "/send-statement",
+)
+
+
+class MockConfig:
+    def __init__(self, latency=0.0, jitter=0.0, error_rate=0.0, hang_rate=0.0, hang_seconds=60.0,
+                 endpoint_latency=None, history_rows=50, seed=None):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.hang_rate = hang_rate
+        self.hang_seconds = hang_seconds
+        self.endpoint_latency = endpoint_latency or {}
+        self.history_rows = history_rows
+        self.random = random.Random(seed)
+
+
+class Account:
+    def __init__(self, number, history_rows):
+        self.number = number
+        self.password = DEFAULT_PASSWORD
+        self.email = f"{number}@example.com"
+        self.balance = STARTING_BALANCE
+        self.version = 0  # bumped on every balance change; served as the balance ETag
+        self.history = []
+        start = datetime(2025, 1, 1)
+        for i in range(history_rows):
+            self.history.append((start + timedelta(hours=i), number, 1000000000 + i % 17,
+                                 round(10 + (i * 37) % 5000 + 0.5, 2), "SUCCESS" if i % 9 else "FAILED"))
+
+
+class MockBank:
+    def __init__(self, config):
+        self.config = config
+        self.accounts = {}
+        self.tokens = {}
+        self.transfers = {}
+        self.lock = threading.Lock()
+
+    def account(self, number):
+        number = str(number)
+        with self.lock:
+            if number not in self.accounts:
+                self.accounts[number] = Account(number, self.config.history_rows)
+            return self.accounts[number]
+
+    def history_table(self, account, since=None):
+        lines = ["Date and Time | Sender | Receiver | Amount | Status", "---|---|---|---|---"]
+        for when, sender, receiver, amount, status in account.history:
+            stamp = when.strftime("%Y-%m-%d %H:%M:%S")
+            if since and stamp < since:
+                continue
+            lines.append(f"{stamp} | {sender} | {receiver} | {amount:.2f} | {status}")
+        return "\n".join(lines)
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    bank = None
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, payload, status=200, headers=None):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _params(self):
+        url = urlparse(self.path)
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        content_type = self.headers.get("Content-Type", "")
+        if raw and "json" in content_type:
+            params.update(json.loads(raw))
+        elif raw:
+            params.update({key: values[0] for key, values in parse_qs(raw.decode("utf-8")).items()})
+        return url.path, params
+
+    def _token_account(self):
+        token = self.headers.get("Authorization", "").removeprefix("Bearer ").strip()
+        return self.bank.tokens.get(token)
+
+    # Sleep for the configured latency and maybe fail; returns True if a response was sent
+    def _inject(self, path):
+        config = self.bank.config
+        rng = config.random
+        delay = config.endpoint_latency.get(path, config.latency)
+        if config.jitter:
+            delay += rng.uniform(0, config.jitter)
+        if delay > 0:
+            time.sleep(delay)
+        if config.hang_rate and rng.random() < config.hang_rate:
+            time.sleep(config.hang_seconds)
+        if config.error_rate and rng.random() < config.error_rate:
+            self._send({"status": "error", "message": "Injected failure"}, 500)
+            return True
+        return False
+
+    def do_GET(self):
+        self._dispatch()
+
+    def do_POST(self):
+        self._dispatch()
+
+    def _dispatch(self):
+        path, params = self._params()
+        if path == "/health":
+            self._send({"status": "ok"})
+            return
+        if path not in ENDPOINTS:
+            self._send({"status": "error", "message": "Not found"}, 404)
+            return
+        if self._inject(path):
+            return
+        handler = getattr(self, "handle_" + path.strip("/").replace("/", "_").replace("-", "_"))
+        handler(params)
+
+    def _otp_ok(self, params):
+        if str(params.get("otp", "")) != MOCK_OTP:
+            self._send({"status": "error", "message": "Invalid OTP"}, 400)
+            return False
+        return True
+
+    def handle_register_init(self, params):
+        self.bank.account(params.get("accountNumber", ""))
+        self._send({"status": "success", "message": "OTP sent"})
+
+    def handle_register_complete(self, params):
+        if self._otp_ok(params):
+            account = self.bank.account(params.get("accountNumber", ""))
+            account.password = params.get("password1", account.password)
+            self._send({"status": "success"})
+
+    def handle_login_request_otp(self, params):
+        account = self.bank.account(params.get("accnumber", ""))
+        if params.get("password") != account.password:
+            self._send({"status": "error", "message": "Invalid account number or password"}, 400)
+            return
+        self._send({"status": "success", "message": "OTP sent"})
+
+    def handle_login_verify(self, params):
+        account = self.bank.account(params.get("accnumber", ""))
+        if params.get("password") != account.password:
+            self._send({"status": "error", "message": "Invalid account number or password"}, 400)
+        elif self._otp_ok(params):
+            token = uuid.uuid4().hex
+            self.bank.tokens[token] = account
+            self._send({"status": "success", "token": token, "accnumber": account.number,
+                        "email": account.email, "balance": account.balance})
+
+    def handle_get_security_question(self, params):
+        self.bank.account(params.get("accountNumber", ""))
+        self._send({"question": SECURITY_QUESTION,
+                    "answerHash": hashlib.sha256(SECURITY_ANSWER.encode()).hexdigest()})
+
+    def handle_verify_security_answer(self, params):
+        if str(params.get("answer", "")).strip().lower() != SECURITY_ANSWER:
+            self._send({"status": "error", "message": "Incorrect security answer"}, 400)
+        else:
+            self._send({"status": "success", "message": "OTP sent"})
+
+    def handle_reset_password(self, params):
+        if self._otp_ok(params):
+            self.bank.account(params.get("accountNumber", "")).password = params.get("newPassword", "")
+            self._send({"status": "success"})
+
+    def handle_transfer_request_otp(self, params):
+        self.bank.account(params.get("fromAccount", ""))
+        self._send({"status": "success", "message": "OTP sent"})
+
+    def handle_transfer(self, params):
+        account = self._token_account()
+        if account is None:
+            self._send({"status": "error", "message": "Unauthorized"}, 401)
+            return
+        key = self.headers.get("Idempotency-Key")
+        if key and key in self.bank.transfers:
+            self._send(self.bank.transfers[key])
+            return
+        if not self._otp_ok(params):
+            return
+        amount = float(params.get("amount", 0))
+        with self.bank.lock:
+            if amount <= 0 or amount > account.balance:
+                self._send({"status": "error", "message": "Insufficient balance"}, 400)
+                return
+            account.balance -= amount
+            account.version += 1
+            now = datetime.now()
+            account.history.append((now, account.number, params.get("toAccount", ""), amount, "SUCCESS"))
+            receiver = self.bank.accounts.get(str(params.get("toAccount", "")))
+            if receiver is not None and receiver is not account:
+                receiver.balance += amount
+                receiver.version += 1
+                receiver.history.append((now, account.number, receiver.number, amount, "SUCCESS"))
+            result = {"status": "success", "message": "Transfer complete", "balance": account.balance}
+            if key:
+                self.bank.transfers[key] = result
+        self._send(result)
+
+    def handle_get_transaction_history(self, params):
+        account = self._token_account()
+        if account is None:
+            self._send({"status": "error", "message": "Unauthorized"}, 401)
+            return
+        self._send({"status": "success", "history": self.bank.history_table(account, params.get("since"))})
+
+    def handle_get_balance(self, params):
+        account = self._token_account()
+        if account is None:
+            self._send({"status": "error", "message": "Unauthorized"}, 401)
+            return
+        etag = f'"{account.number}-{account.version}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self._send({"status": "success", "balance": account.balance}, headers={"ETag": etag})
+
+    def handle_send_statement(self, params):
+        if self._token_account() is None:
+            self._send({"status": "error", "message": "Unauthorized"}, 401)
+            return
+        self._send({"status": "success", "message": "Statement sent"})
+
+
+# Start the mock on a background thread; returns the server (server_address holds the port)
+def start(config=None, host="127.0.0.1", port=0):
+    handler = type("MockHandler", (Handler,), {"bank": MockBank(config or MockConfig())})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="mock-backend", daemon=True).start()
+    return server
+
+
+def parse_endpoint_latency(values):
+    latency = {}
+    for value in values or ():
+        path, _, seconds = value.partition("=")
+        latency[path] = float(seconds)
+    return latency
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for the Nex Bank backend")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="base latency per request, seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra uniform random latency, seconds")
+    parser.add_argument("--endpoint-latency", action="append", metavar="PATH=SECONDS",
+                        help="latency override for one endpoint, repeatable")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with 500")
+    parser.add_argument("--hang-rate", type=float, default=0.0, help="fraction of requests that hang")
+    parser.add_argument("--hang-seconds", type=float, default=60.0)
+    parser.add_argument("--history-rows", type=int, default=50, help="seeded history rows per account")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    config = MockConfig(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                        hang_rate=args.hang_rate, hang_seconds=args.hang_seconds,
+                        endpoint_latency=parse_endpoint_latency(args.endpoint_latency),
+                        history_rows=args.history_rows, seed=args.seed)
+    server = start(config, args.host, args.port)
+    print(f"mock backend listening on http://{args.host}:{server.server_address[1]}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
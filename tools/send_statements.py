@@ -0,0 +1,84 @@
+# Send month statements for many accounts at once through the async backend client,
+# with a bounded number of requests in flight, and report the outcome per account.
+#
+#   python tools/send_statements.py --token $TOKEN --month 1 --year 2025 accounts.txt
+#   python tools/send_statements.py --token $TOKEN --month 1 --year 2025 --concurrency 32 - < accounts.txt
+#
+# The accounts file holds one account number per line; blank lines and lines starting
+# with # are skipped.
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def read_accounts(path):
+    stream = sys.stdin if path == "-" else open(path)
+    with stream:
+        return [line.strip() for line in stream if line.strip() and not line.startswith("#")]
+
+
+# "Statement sent" or the reason it was not, in the dashboard's wording
+def outcome(result):
+    import requests
+
+    if isinstance(result, requests.exceptions.RequestException):
+        return False, f"Failed to send statement: {str(result)}"
+    if isinstance(result, Exception):
+        return False, f"Failed to send statement: {type(result).__name__}: {str(result)}"
+    if result.status_code == 200:
+        return True, "Statement sent"
+    try:
+        message = result.json().get("message", "Unknown error")
+    except ValueError:
+        message = "Invalid response from server."
+    return False, f"Failed to send statement: {message}"
+
+
+async def send_all(accounts, token, month, year, concurrency):
+    from nexbank.async_backend import AsyncBackend
+
+    client = AsyncBackend(concurrency)
+    try:
+        return await asyncio.gather(
+            *(client.send_statement(token, account, month, year) for account in accounts),
+            return_exceptions=True
+        )
+    finally:
+        client.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Send month statements for many accounts")
+    parser.add_argument("accounts", help="file with one account number per line, or - for stdin")
+    parser.add_argument("--token", required=True, help="bearer token accepted for these accounts")
+    parser.add_argument("--month", type=int, required=True)
+    parser.add_argument("--year", type=int, required=True)
+    parser.add_argument("--concurrency", type=int, default=16, help="requests in flight at once")
+    parser.add_argument("--backend-url", help="backend to use; default NEXBANK_BACKEND_URL")
+    args = parser.parse_args()
+
+    if args.backend_url:
+        # Read by nexbank.backend on import
+        os.environ["NEXBANK_BACKEND_URL"] = args.backend_url
+    accounts = read_accounts(args.accounts)
+
+    start = time.perf_counter()
+    results = asyncio.run(send_all(accounts, args.token, args.month, args.year, args.concurrency))
+    elapsed = time.perf_counter() - start
+
+    sent = 0
+    for account, result in zip(accounts, results):
+        ok, message = outcome(result)
+        sent += ok
+        print(f"{account}\t{'ok' if ok else 'failed'}\t{message}")
+    print(f"{sent}/{len(accounts)} statements sent in {elapsed:.1f}s", file=sys.stderr)
+    sys.exit(0 if sent == len(accounts) else 1)
+
+
+if __name__ == "__main__":
+    main()